@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import os
-import json
 import time
 import asyncio
 from datetime import datetime, timezone, timedelta
+from utils import state_store
 IST = timezone(timedelta(hours=5, minutes=30))
 
 
@@ -38,25 +37,13 @@ class CreatorAgent:
             self.logger.warning(f"[CreatorAgent] Already creating repository {self.active_repo_creation}. Skipping new creation request.")
             return
             
-        state_path = os.path.join(os.getcwd(), "monsterrr_state.json")
-        state = {}
-        if os.path.exists(state_path):
-            with open(state_path, "r", encoding="utf-8") as f:
-                try:
-                    state = json.load(f)
-                except Exception:
-                    state = {}
-        repos = state.get("repos", [])
-        
         # Get current organization stats for better awareness
         try:
             org_stats = self.github_service.get_organization_stats()
             self.logger.info(f"[CreatorAgent] Organization stats: {org_stats.get('total_repos', 0)} repos, {org_stats.get('members', 0)} members")
             
             # Update state with organization stats
-            state["organization_stats"] = org_stats
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            state_store.update(lambda state: state.update(organization_stats=org_stats))
         except Exception as e:
             self.logger.error(f"[CreatorAgent] Error getting org stats: {e}")
             org_stats = {"repositories": []}
@@ -94,10 +81,7 @@ class CreatorAgent:
                     "audience": audience,
                     "status": "creating"  # Track repository creation status
                 }
-                repos.append(repo_entry)
-                state["repos"] = repos
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(state, f, indent=2)
+                state_store.update(lambda state: state.setdefault("repos", []).append(dict(repo_entry)))
             except Exception as e:
                 self.logger.error(f"[CreatorAgent] Error creating repo: {e}")
                 self.active_repo_creation = None
@@ -123,14 +107,12 @@ class CreatorAgent:
                     )
                 
                 # Update state with project board info
-                state["project_boards"] = state.get("project_boards", [])
-                state["project_boards"].append({
+                board_entry = {
                     "repo": repo_name,
                     "project_issue_number": project_board["number"],
                     "url": project_board["html_url"] if "html_url" in project_board else f"{repo.get('html_url', '')}/issues/{project_board['number']}"
-                })
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(state, f, indent=2)
+                }
+                state_store.update(lambda state: state.setdefault("project_boards", []).append(board_entry))
             except Exception as e:
                 self.logger.error(f"[CreatorAgent] Error creating project board: {e}")
                 
@@ -138,26 +120,29 @@ class CreatorAgent:
                 self._scaffold_complete_project(repo_name, description, roadmap, tech_stack, idea)
                 
                 # Mark repository as complete with fully working code
-                for repo_entry in state.get("repos", []):
-                    if repo_entry["name"] == repo_name:
-                        repo_entry["status"] = "complete"
-                        # Use Jarvis-like intelligence to decide final visibility
-                        final_visibility_private = self._jarvis_final_visibility_decision(
-                            repo_name, description, project_type, audience, tech_stack, 
-                            repo_entry["visibility"] == "private"
-                        )
-                        
-                        # Update visibility if needed
-                        if final_visibility_private != (repo_entry["visibility"] == "private"):
-                            try:
-                                self.github_service.update_repository_visibility(repo_name, private=final_visibility_private)
-                                repo_entry["visibility"] = "private" if final_visibility_private else "public"
-                                self.logger.info(f"[CreatorAgent] Updated repository {repo_name} visibility to {'private' if final_visibility_private else 'public'}")
-                            except Exception as e:
-                                self.logger.error(f"[CreatorAgent] Error updating repository visibility: {e}")
-                        break
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(state, f, indent=2)
+                repo_entry["status"] = "complete"
+                # Use Jarvis-like intelligence to decide final visibility
+                final_visibility_private = self._jarvis_final_visibility_decision(
+                    repo_name, description, project_type, audience, tech_stack, 
+                    repo_entry["visibility"] == "private"
+                )
+                
+                # Update visibility if needed
+                if final_visibility_private != (repo_entry["visibility"] == "private"):
+                    try:
+                        self.github_service.update_repository_visibility(repo_name, private=final_visibility_private)
+                        repo_entry["visibility"] = "private" if final_visibility_private else "public"
+                        self.logger.info(f"[CreatorAgent] Updated repository {repo_name} visibility to {'private' if final_visibility_private else 'public'}")
+                    except Exception as e:
+                        self.logger.error(f"[CreatorAgent] Error updating repository visibility: {e}")
+                
+                completed = {"status": repo_entry["status"], "visibility": repo_entry["visibility"]}
+                def mark_complete(state):
+                    for entry in state.get("repos", []):
+                        if entry.get("name") == repo_name:
+                            entry.update(completed)
+                            break
+                state_store.update(mark_complete)
                     
                 self.logger.info(f"[CreatorAgent] Successfully completed creation of repository {repo_name} with complete, working code")
             except Exception as e:
@@ -12,8 +12,8 @@ class CustomAgent:
     def _load_log(self):
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(self.file_path, "rb") as f:
+                    return json.loads(f.read())
             except Exception:
                 return []
         return []
@@ -284,8 +284,8 @@ class IdeaGeneratorAgent:
         """Load the monsterrr state from file."""
         if os.path.exists(self.IDEA_FILE):
             try:
-                with open(self.IDEA_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(self.IDEA_FILE, "rb") as f:
+                    return json.loads(f.read())
             except Exception as e:
                 self.logger.error(f"[IdeaGeneratorAgent] Error loading state: {e}")
                 return {}
@@ -1,10 +1,12 @@
 from typing import Dict, Any
-import os
-import json
 import time
 import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
+from utils import state_store
 IST = timezone(timedelta(hours=5, minutes=30))
+# Stale-issue closes still pass through GitHubService's global request spacing; this only overlaps their round trips
+STALE_CLOSE_WORKERS = 4
 
 
 class MaintainerAgent:
@@ -270,10 +272,8 @@ IMPORTANT: Limit your response to exactly {num_contributions} contributions to p
         """Enhance the agent's consciousness level based on experiences."""
         try:
             # Load experiences from state
-            if os.path.exists("monsterrr_state.json"):
-                with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                    state = json.load(f)
-                
+            state = state_store.get()
+            if state:
                 actions = state.get("actions", [])
                 repos = state.get("repos", [])
                 
@@ -432,30 +432,16 @@ Track recent commits, issues, and PRs here.
                 self.logger.info(f"[MaintainerAgent] Created project tracking issue for {repo}")
                 
                 # Log this action
-                import os
-                import json
-                state_path = os.path.join(os.getcwd(), "monsterrr_state.json")
-                if os.path.exists(state_path):
-                    with open(state_path, "r", encoding="utf-8") as f:
-                        try:
-                            state = json.load(f)
-                        except Exception:
-                            state = {}
-                    
-                    actions = state.get("actions", [])
-                    actions.append({
-                        "timestamp": datetime.now().isoformat(),
-                        "type": "project_tracking_created",
-                        "details": {
-                            "repo": repo,
-                            "issue_number": issue.get("number", "unknown"),
-                            "issue_url": issue.get("html_url", "")
-                        }
-                    })
-                    state["actions"] = actions
-                    
-                    with open(state_path, "w", encoding="utf-8") as f:
-                        json.dump(state, f, indent=2)
+                action = {
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "project_tracking_created",
+                    "details": {
+                        "repo": repo,
+                        "issue_number": issue.get("number", "unknown"),
+                        "issue_url": issue.get("html_url", "")
+                    }
+                }
+                state_store.update(lambda state: state.setdefault("actions", []).append(action))
                 
         except Exception as e:
             self.logger.error(f"[MaintainerAgent] Error creating project tracking for {repo}: {e}")
@@ -521,6 +507,7 @@ Track recent commits, issues, and PRs here.
 
     def _handle_issues(self, repo: str):
         issues = self.github_service.list_issues(repo, state="open")
+        stale_numbers = set()
         for issue in issues:
             if "pull_request" in issue:
                 continue  # skip PRs
@@ -529,8 +516,7 @@ Track recent commits, issues, and PRs here.
             created_at = issue.get("created_at")
             last_updated = issue.get("updated_at", created_at)
             if self._is_stale(last_updated):
-                self.github_service.close_issue(repo, number)
-                self.logger.info(f"[MaintainerAgent] Closed stale issue #{number} in {repo}")
+                stale_numbers.add(number)
                 continue
             # Respond to issues with Groq suggestion
             try:
@@ -547,6 +533,20 @@ Track recent commits, issues, and PRs here.
                 self.logger.info(f"[MaintainerAgent] Suggested fix for issue #{number} in {repo}")
             except Exception as e:
                 self.logger.error(f"[MaintainerAgent] Error suggesting fix for issue #{number}: {e}")
+        if stale_numbers:
+            self._close_stale_issues(repo, sorted(stale_numbers))
+
+    def _close_stale_issues(self, repo: str, numbers: list):
+        """Close stale issues with a few requests in flight at once instead of one round trip at a time."""
+        with ThreadPoolExecutor(max_workers=min(STALE_CLOSE_WORKERS, len(numbers))) as pool:
+            futures = {pool.submit(self.github_service.close_issue, repo, number): number for number in numbers}
+            for future in as_completed(futures):
+                number = futures[future]
+                try:
+                    future.result()
+                    self.logger.info(f"[MaintainerAgent] Closed stale issue #{number} in {repo}")
+                except Exception as e:
+                    self.logger.error(f"[MaintainerAgent] Error closing stale issue #{number} in {repo}: {e}")
 
     def _handle_pull_requests(self, repo: str):
         prs = self.github_service.list_issues(repo, state="open")
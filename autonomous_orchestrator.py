@@ -1,4 +1,3 @@
-import json
 import gc
 import asyncio
 import logging
@@ -12,6 +11,7 @@ from services.github_service import GitHubService
 from services.groq_service import GroqService
 from utils.logger import setup_logger
 from utils.config import Settings
+from utils import state_store
 
 # Initialize services and agents
 logger = setup_logger()
@@ -55,22 +55,13 @@ except Exception as e:
 
 def log_monsterrr_action(action_type, details):
     """Append an action to monsterrr_state.json for daily reporting."""
-    state_path = "monsterrr_state.json"
+    entry = {
+        "timestamp": datetime.now().isoformat(),
+        "type": action_type,
+        "details": details
+    }
     try:
-        if os.path.exists(state_path):
-            with open(state_path, "r", encoding="utf-8") as f:
-                state = json.load(f)
-        else:
-            state = {}
-        actions = state.get("actions", [])
-        actions.append({
-            "timestamp": datetime.now().isoformat(),
-            "type": action_type,
-            "details": details
-        })
-        state["actions"] = actions
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        state_store.update(lambda state: state.setdefault("actions", []).append(entry))
     except Exception as e:
         logger.error(f"Failed to log action: {e}")
 
@@ -80,6 +71,27 @@ Runs daily: fetches ideas, plans 3 AI contributions, executes them, and maintain
 Now includes enhanced memory management to prevent exceeding Render limits.
 """
 
+async def _fetch_org_stats():
+    """Fetch organization stats for better awareness; returns {} on failure."""
+    try:
+        org_stats = await asyncio.to_thread(github.get_organization_stats)
+        logger.info(f"[Orchestrator] Organization stats: {org_stats.get('total_repos', 0)} repos, {org_stats.get('members', 0)} members")
+        return org_stats
+    except Exception as e:
+        logger.error(f"[Orchestrator] Error getting organization stats: {e}")
+        return {}
+
+async def _fetch_ideas():
+    """Fetch and rank new ideas (limit to 3 to prevent memory issues); returns [] on failure."""
+    try:
+        ideas = await asyncio.to_thread(idea_agent.fetch_and_rank_ideas, top_n=3)
+        logger.info(f"[Orchestrator] Fetched and ranked {len(ideas)} ideas.")
+        log_monsterrr_action("ideas_fetched", {"count": len(ideas), "ideas": [i.get('name','') for i in ideas]})
+        return ideas
+    except Exception as e:
+        logger.error(f"[Orchestrator] Error fetching ideas: {e}")
+        return []
+
 async def daily_orchestration():
     # Check if services are properly initialized
     if not all([groq, github, idea_agent, maintainer_agent, creator_agent]):
@@ -89,34 +101,20 @@ async def daily_orchestration():
     while True:
         logger.info("[Orchestrator] Starting daily AI orchestration cycle.")
         
-        # Get organization stats for better awareness
-        try:
-            org_stats = github.get_organization_stats()
-            logger.info(f"[Orchestrator] Organization stats: {org_stats.get('total_repos', 0)} repos, {org_stats.get('members', 0)} members")
-            
-            # Update state with organization stats
-            state_path = "monsterrr_state.json"
-            if os.path.exists(state_path):
-                with open(state_path, "r", encoding="utf-8") as f:
-                    try:
-                        state = json.load(f)
-                    except Exception:
-                        state = {}
-                state["organization_stats"] = org_stats
-                with open(state_path, "w", encoding="utf-8") as f:
-                    json.dump(state, f, indent=2)
-        except Exception as e:
-            logger.error(f"[Orchestrator] Error getting organization stats: {e}")
-            org_stats = {}
+        # Org stats and idea fetching hit unrelated APIs, so run them side by side.
+        # Each one handles its own errors, so a failure in one never cancels the other.
+        # The idea agent stores its ranked ideas in the state itself; only the stats are needed here.
+        async with asyncio.TaskGroup() as tg:
+            stats_task = tg.create_task(_fetch_org_stats())
+            tg.create_task(_fetch_ideas())
+        org_stats = stats_task.result()
         
-        # 1. Fetch and rank new ideas (limit to 3 to prevent memory issues)
-        try:
-            ideas = idea_agent.fetch_and_rank_ideas(top_n=3)
-            logger.info(f"[Orchestrator] Fetched and ranked {len(ideas)} ideas.")
-            log_monsterrr_action("ideas_fetched", {"count": len(ideas), "ideas": [i.get('name','') for i in ideas]})
-        except Exception as e:
-            logger.error(f"[Orchestrator] Error fetching ideas: {e}")
-            ideas = []
+        # Update state with organization stats only after the idea agent has saved its own changes
+        if org_stats:
+            try:
+                state_store.update(lambda state: state.update(organization_stats=org_stats))
+            except Exception as e:
+                logger.error(f"[Orchestrator] Error saving organization stats: {e}")
         
         # 2. Plan 3 daily contributions (limit to prevent memory issues)
         try:
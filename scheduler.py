@@ -3,145 +3,211 @@ Scheduler for Monsterrr's daily operations.
 """
 
 import asyncio
+import atexit
+import functools
+import threading
+import time
 import os
-import json
+import signal
+import string
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from html import escape as html_escape
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from utils.config import Settings
 from utils.logger import setup_logger
+from utils import state_store
 import traceback
 from agents.idea_agent import IdeaGeneratorAgent
 from agents.creator_agent import CreatorAgent
 from agents.maintainer_agent import MaintainerAgent
 from services.groq_service import GroqService
 from services.github_service import GitHubService
-from services.reporting_service import ReportingService
+from services.reporting_service import ReportingService, build_message, send_message_batched
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-import json
 import os
 
+os.makedirs("logs", exist_ok=True)
+STARTUP_EMAIL_SENTINEL = os.path.join("logs", ".startup_email_sent")
+# Holds the PID of the process that owns the scheduler; see _acquire_scheduler_lock()
+SCHEDULER_LOCK = os.path.join("logs", "scheduler.pid")
+# Older actions are dropped so the state file (and its serialization cost) stays bounded
+MAX_STATE_ACTIONS = 1000
+
 settings = Settings()
 logger = setup_logger()
-groq = GroqService(api_key=settings.GROQ_API_KEY, logger=logger)
-github = GitHubService(logger=logger)
-github.groq_client = groq  # Pass Groq client to GitHub service for use in issue analysis
-idea_agent = IdeaGeneratorAgent(groq, logger)
-creator_agent = CreatorAgent(github, logger)
-maintainer_agent = MaintainerAgent(github, groq, logger)
-
-# Initialize reporting service
-reporting_service = ReportingService(
-    smtp_host=settings.SMTP_HOST,
-    smtp_port=settings.SMTP_PORT,
-    smtp_user=settings.SMTP_USER,
-    smtp_pass=settings.SMTP_PASS,
-    logger=logger
-)
+
+# Settings are fixed for the life of the process, so resolve the SMTP config once
+_SMTP_HOST = settings.SMTP_HOST
+_SMTP_PORT = settings.SMTP_PORT or 587
+_SMTP_USER = settings.SMTP_USER
+_SMTP_PASS = settings.SMTP_PASS
+_RECIPIENTS = settings.recipients
+_SMTP_READY = bool(_SMTP_HOST and _SMTP_USER and _SMTP_PASS)
+
+# Services and agents are built on first use so importing this module stays cheap;
+# each factory is cached, so a job only constructs what it actually touches
+@functools.cache
+def _groq():
+    return GroqService(api_key=settings.GROQ_API_KEY, logger=logger)
+
+@functools.cache
+def _github():
+    github = GitHubService(logger=logger)
+    github.groq_client = _groq()  # Pass Groq client to GitHub service for use in issue analysis
+    return github
+
+@functools.cache
+def _idea_agent():
+    return IdeaGeneratorAgent(_groq(), logger)
+
+@functools.cache
+def _creator_agent():
+    return CreatorAgent(_github(), logger)
+
+@functools.cache
+def _maintainer_agent():
+    return MaintainerAgent(_github(), _groq(), logger)
+
+@functools.cache
+def _reporting():
+    return ReportingService(
+        smtp_host=settings.SMTP_HOST,
+        smtp_port=settings.SMTP_PORT,
+        smtp_user=settings.SMTP_USER,
+        smtp_pass=settings.SMTP_PASS,
+        logger=logger
+    )
 
 scheduler = AsyncIOScheduler()
 
+# One SMTP session shared by every email path; see _get_smtp()
+_smtp_conn = None
+# Every use of that session runs on this single worker, which keeps it off the event loop
+# and serialises access without a lock
+_smtp_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+# Servers drop idle sessions after a few minutes; a NOOP this often keeps ours usable between sends
+SMTP_KEEPALIVE_INTERVAL = 120
+
+# Held for the whole of daily_job so an overrunning run is never joined by a second one
+_daily_job_lock = threading.Lock()
+
+ORG_STATS_TTL = 300
+
+# quick_check is a heartbeat; it has nothing to add this soon after a successful daily_job
+QUICK_CHECK_QUIET_PERIOD = timedelta(hours=2)
+# (monotonic fetch time, stats) for _cached_org_stats()
+_org_stats_cache = (0.0, None)
+# Serialises refreshes so callers in different worker threads share a single GitHub fetch
+_org_stats_lock = threading.Lock()
+
+def _cached_org_stats():
+    """Return organization stats, hitting the GitHub API at most once per ORG_STATS_TTL seconds.
+
+    Concurrent callers wait for one in-flight refresh instead of each making their own. If a
+    refresh fails, the last good stats (from memory, else the state file) are returned instead
+    of raising.
+    """
+    global _org_stats_cache
+    with _org_stats_lock:
+        fetched_at, stats = _org_stats_cache
+        if stats is not None and time.monotonic() - fetched_at <= ORG_STATS_TTL:
+            return stats
+        try:
+            stats = _github().get_organization_stats()
+        except Exception as e:
+            stale = stats or state_store.get().get("organization_stats")
+            if not stale:
+                raise
+            logger.warning("[Scheduler] Organization stats refresh failed, using last known stats: %s", e)
+            return stale
+        _org_stats_cache = (time.monotonic(), stats)
+        return stats
+
 def daily_job():
     """Enhanced daily job that ensures actual work is performed."""
+    if not _daily_job_lock.acquire(blocking=False):
+        logger.warning("[Scheduler] Previous daily job is still running. Skipping this run.")
+        return
     logger.info("[Scheduler] Running enhanced daily job: MaintainerAgent plans and executes 3 contributions + status report.")
     
     try:
+        maintainer = _maintainer_agent()
+        
         # Generate new ideas
         logger.info("[Scheduler] Generating new ideas...")
-        ideas = idea_agent.generate_ideas(count=5)
-        logger.info(f"[Scheduler] Generated {len(ideas)} ideas.")
+        ideas = _idea_agent().generate_ideas(count=5)
+        logger.info("[Scheduler] Generated %d ideas.", len(ideas))
         
         # Plan daily contributions
         logger.info("[Scheduler] Planning daily contributions...")
-        plan = maintainer_agent.plan_daily_contributions(ideas)
-        logger.info(f"[Scheduler] Planned {len(plan)} contributions.")
+        plan = maintainer.plan_daily_contributions(ideas)
+        logger.info("[Scheduler] Planned %d contributions.", len(plan))
         
         # Execute the plan
         logger.info("[Scheduler] Executing daily plan...")
-        results = maintainer_agent.execute_plan(plan)
-        logger.info(f"[Scheduler] Executed {len(results)} contributions.")
+        results = maintainer.execute_plan(plan)
+        logger.info("[Scheduler] Executed %d contributions.", len(results))
         
-        # Update state file with actions
-        state_path = "monsterrr_state.json"
-        state = {}
-        if os.path.exists(state_path):
-            with open(state_path, "r", encoding="utf-8") as f:
-                try:
-                    state = json.load(f)
-                except Exception:
-                    state = {}
+        # Perform maintenance tasks
+        logger.info("[Scheduler] Performing maintenance tasks...")
+        maintainer.perform_maintenance()
         
-        # Add actions to state
-        actions = state.get("actions", [])
-        for result in results:
-            actions.append({
-                "timestamp": datetime.utcnow().isoformat(),
-                "type": "contribution_executed",
-                "details": result
-            })
-        state["actions"] = actions
+        # Add actions to state; the store picks up whatever the agents above wrote to the file
+        timestamp = datetime.utcnow().isoformat()
+        new_actions = [
+            {"timestamp": timestamp, "type": "contribution_executed", "details": result}
+            for result in results
+        ]
         
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        def record_actions(state):
+            actions = state.get("actions", [])
+            actions.extend(new_actions)
+            state["actions"] = actions[-MAX_STATE_ACTIONS:]
         
-        # Perform maintenance tasks
-        logger.info("[Scheduler] Performing maintenance tasks...")
-        maintainer_agent.perform_maintenance()
+        state_store.update(record_actions)
         
         # After execution, send status report
         send_status_report()
+        state_store.update(lambda state: state.update(last_successful_daily=datetime.utcnow().isoformat()))
+        state_store.flush()
         
     except Exception as e:
-        logger.error(f"[Scheduler] Error in daily job: {e}\n{traceback.format_exc()}")
+        logger.error("[Scheduler] Error in daily job: %s\n%s", e, traceback.format_exc())
+    finally:
+        _daily_job_lock.release()
 
-def send_status_report():
-    """Send daily status report only once per day."""
+async def send_status_report_async():
+    """Send daily status report only once per day over the shared SMTP session."""
     logger.info("[Scheduler] Checking if daily status report should be sent.")
     try:
-        state_path = "monsterrr_state.json"
         flag_key = "scheduler_daily_report_sent"
         date_key = "scheduler_daily_report_date"
-        
-        # Load current state
-        state = {}
-        if os.path.exists(state_path):
-            with open(state_path, "r", encoding="utf-8") as f:
-                try:
-                    state = json.load(f)
-                except Exception:
-                    state = {}
+        state = await asyncio.to_thread(state_store.get)
         
         # Check if daily report has already been sent today
-        from datetime import datetime
         today = datetime.utcnow().strftime('%Y-%m-%d')
         last_sent_date = state.get(date_key, "")
         
         if last_sent_date == today:
-            logger.info(f"[Scheduler] Daily status report already sent today ({today}), skipping.")
+            logger.info("[Scheduler] Daily status report already sent today (%s), skipping.", today)
             return
         
         # Generate comprehensive report
-        report = reporting_service.generate_comprehensive_report()
+        report = _reporting().generate_comprehensive_report(state)
+        state_store.update(lambda state: state.update(last_report=report, last_report_time=datetime.utcnow().isoformat()))
         
         # Send email report if configured
-        if settings.SMTP_HOST and settings.SMTP_USER and settings.SMTP_PASS and settings.STATUS_REPORT_RECIPIENTS:
-            recipients = settings.recipients
-            success = reporting_service.send_email_report(recipients, report)
+        recipients = _RECIPIENTS
+        if _SMTP_READY and recipients:
+            success = await asyncio.get_running_loop().run_in_executor(_smtp_pool, _send_report_email, recipients, report)
             if success:
                 logger.info("[Scheduler] Email status report sent successfully.")
                 
-                # Update state to mark daily report as sent today
-                try:
-                    state[flag_key] = True
-                    state[date_key] = today
-                    with open(state_path, "w", encoding="utf-8") as f:
-                        json.dump(state, f, indent=2)
-                    logger.info(f"[Scheduler] Daily status report state updated for {today}.")
-                except Exception as e:
-                    logger.error(f"[Scheduler] Failed to update state file after sending daily report: {e}")
+                # Mark daily report as sent today
+                state_store.update(lambda state: state.update({flag_key: True, date_key: today}))
             else:
                 logger.error("[Scheduler] Failed to send email status report.")
         else:
@@ -154,127 +220,260 @@ def send_status_report():
                 missing.append("SMTP_USER")
             if not settings.SMTP_PASS:
                 missing.append("SMTP_PASS")
-            if not settings.STATUS_REPORT_RECIPIENTS:
+            if not recipients:
                 missing.append("STATUS_REPORT_RECIPIENTS")
-            logger.info(f"[Scheduler] Missing configuration: {', '.join(missing)}")
-        
-        # Update state file with report data
-        state["last_report"] = report
-        state["last_report_time"] = datetime.utcnow().isoformat()
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+            logger.info("[Scheduler] Missing configuration: %s", ", ".join(missing))
             
     except Exception as e:
-        logger.error(f"[Scheduler] Failed to send status report: {e}\n{traceback.format_exc()}")
+        logger.error("[Scheduler] Failed to send status report: %s\n%s", e, traceback.format_exc())
 
-def send_startup_email():
-    logger.info("[Scheduler] Sending one-time startup status email.")
-    
-    # Check if SMTP is configured
-    if not settings.SMTP_HOST or not settings.SMTP_USER or not settings.SMTP_PASS:
-        logger.warning("[Scheduler] SMTP not configured. Skipping startup email.")
-        return
-        
-    state = {}
-    if os.path.exists("monsterrr_state.json"):
-        with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-            try:
-                state = json.load(f)
-            except Exception:
-                state = {}
-    
-    # Get organization stats to include in the report
-    try:
-        org_stats = github.get_organization_stats()
-        # Update state with organization stats
-        state["organization_stats"] = org_stats
-        with open("monsterrr_state.json", "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except Exception as e:
-        logger.error(f"[Scheduler] Failed to get organization stats: {e}")
-        org_stats = {}
-    
-    # Always define subject, html, and text, even if state is empty
-    subject = "🚀 Monsterrr is Now Live! | Initial System Status"
-    
-    # Generate comprehensive report for startup email
-    report = reporting_service.generate_comprehensive_report()
-    summary = report.get("summary", {})
-    
-    html = f"""
+def send_status_report():
+    """Blocking entry point for callers without a running event loop (e.g. daily_job in the executor)."""
+    asyncio.run(send_status_report_async())
+
+# Startup email bodies are static apart from a handful of counters, so build the templates once
+_STARTUP_HTML_TMPL = string.Template("""
 <div style='font-family:Segoe UI,Arial,sans-serif;max-width:600px;margin:0 auto;background:#f9f9fb;padding:32px 24px;border-radius:12px;border:1px solid #e3e7ee;'>
     <h1 style='color:#2d7ff9;margin-bottom:0.2em;'>Monsterrr is Now Live!</h1>
     <p style='font-size:1.1em;color:#333;margin-top:0;'>
         <b>Welcome to your autonomous GitHub organization manager.</b><br>
-        <b>Organization:</b> {settings.GITHUB_ORG or 'Not configured'}
+        <b>Organization:</b> $org
     </p>
     <hr style='border:0;border-top:1px solid #e3e7ee;margin:18px 0;'>
     <h2 style='color:#222;font-size:1.15em;margin-bottom:0.5em;'>Initial System Status</h2>
     <ul style='line-height:1.7;font-size:1.05em;'>
-        <li><b>Repositories detected:</b> {summary.get('repositories', 0)}</li>
-        <li><b>Organization members:</b> {org_stats.get('members', 0) if org_stats else 0}</li>
-        <li><b>Ideas generated:</b> {summary.get('ideas', 0)}</li>
-        <li><b>Actions performed:</b> {summary.get('actions', 0)}</li>
-        <li><b>Branches created:</b> {summary.get('branches', 0)}</li>
+        <li><b>Repositories detected:</b> $repos</li>
+        <li><b>Organization members:</b> $members</li>
+        <li><b>Ideas generated:</b> $ideas</li>
+        <li><b>Actions performed:</b> $actions</li>
+        <li><b>Branches created:</b> $branches</li>
     </ul>
     <hr style='border:0;border-top:1px solid #e3e7ee;margin:18px 0;'>
     <p style='font-size:1em;color:#2d7ff9;'><b>Monsterrr is now running and will keep your organization healthy and growing, 24/7.</b></p>
     <p style='font-size:0.95em;color:#888;'>This is a one-time launch notification from Monsterrr.</p>
 </div>
-"""
-    text = f"""
+""")
+_STARTUP_TEXT_TMPL = string.Template("""
 Monsterrr is Now Live!
 
-Organization: {settings.GITHUB_ORG or 'Not configured'}
+Organization: $org
 
 Initial System Status:
-Repositories detected: {summary.get('repositories', 0)}
-Organization members: {org_stats.get('members', 0) if org_stats else 0}
-Ideas generated: {summary.get('ideas', 0)}
-Actions performed: {summary.get('actions', 0)}
-Branches created: {summary.get('branches', 0)}
+Repositories detected: $repos
+Organization members: $members
+Ideas generated: $ideas
+Actions performed: $actions
+Branches created: $branches
 
 Monsterrr is now running and will keep your organization healthy and growing, 24/7.
 
 --
 This is a one-time launch notification from Monsterrr.
-"""
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = subject
-    msg['From'] = settings.SMTP_USER
-    msg['To'] = ", ".join(settings.recipients) if settings.recipients else settings.SMTP_USER
-    msg.attach(MIMEText(text, 'plain'))
-    msg.attach(MIMEText(html, 'html'))
+""")
+
+@functools.lru_cache(maxsize=8)
+def _render_startup_bodies(org, repos, members, ideas, actions, branches):
+    """Return the (html, text) startup bodies; repeated sends with the same counters reuse the render."""
+    fields = dict(repos=repos, members=members, ideas=ideas, actions=actions, branches=branches)
+    html = _STARTUP_HTML_TMPL.substitute(fields, org=html_escape(org))
+    text = _STARTUP_TEXT_TMPL.substitute(fields, org=org)
+    return html, text
+
+def _build_startup_message():
+    """Build the one-time launch notification as a ready-to-send email message."""
+    # Get organization stats to include in the report
+    try:
+        org_stats = _cached_org_stats()
+        # Update state with organization stats
+        state_store.update(lambda state: state.update(organization_stats=org_stats))
+    except Exception as e:
+        logger.error("[Scheduler] Failed to get organization stats: %s", e)
+        org_stats = {}
+    
+    # Always define subject, html, and text, even if state is empty
+    subject = "🚀 Monsterrr is Now Live! | Initial System Status"
+    
+    # Generate comprehensive report for startup email
+    report = _reporting().generate_comprehensive_report(state_store.get())
+    summary = report.get("summary", {})
+    
+    html, text = _render_startup_bodies(
+        settings.GITHUB_ORG or 'Not configured',
+        summary.get('repositories', 0),
+        org_stats.get('members', 0) if org_stats else 0,
+        summary.get('ideas', 0),
+        summary.get('actions', 0),
+        summary.get('branches', 0),
+    )
+    return build_message(subject, _SMTP_USER, _RECIPIENTS or [_SMTP_USER], text, html)
+
+def _open_smtp():
+    """Open an SMTP session with STARTTLS and AUTH already done."""
+    server = smtplib.SMTP(_SMTP_HOST, _SMTP_PORT)
+    try:
+        server.starttls()
+        server.login(_SMTP_USER, _SMTP_PASS)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+def _get_smtp():
+    """Return the shared SMTP session, reconnecting if the server dropped it.
+
+    Only call this (and use the session) from the ``_smtp_pool`` worker.
+    """
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.noop()
+            return _smtp_conn
+        except (smtplib.SMTPServerDisconnected, OSError):
+            logger.info("[Scheduler] SMTP session dropped, reconnecting.")
+            _smtp_conn = None
+    _smtp_conn = _open_smtp()
+    return _smtp_conn
+
+def _close_smtp():
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.quit()
+        except Exception:
+            pass
+        _smtp_conn = None
+
+atexit.register(_close_smtp)
+
+def _smtp_keepalive():
+    """NOOP the shared session, if open, so the next email skips the TLS and AUTH handshake.
+
+    Runs on the ``_smtp_pool`` worker.
+    """
+    global _smtp_conn
+    if _smtp_conn is None:
+        return
+    try:
+        _smtp_conn.noop()
+    except (smtplib.SMTPServerDisconnected, OSError):
+        _smtp_conn = None  # _get_smtp() reconnects on the next send
+
+def _send_report_email(recipients, report):
+    try:
+        server = _get_smtp()
+    except Exception as e:
+        logger.error("[Scheduler] Could not open SMTP session for status report: %s", e)
+        return False
+    return _reporting().send_email_report(recipients, report, server=server)
+
+def _send_email_sync(msg, to_addrs):
+    return send_message_batched(_get_smtp(), msg, _SMTP_USER, to_addrs, logger)
+
+async def send_email(msg, to_addrs):
+    """Send ``msg`` over the shared SMTP session without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_smtp_pool, _send_email_sync, msg, to_addrs)
+
+async def send_startup_email():
+    """Send the one-time startup email over the shared SMTP session."""
+    logger.info("[Scheduler] Sending one-time startup status email.")
+    
+    # Check if SMTP is configured
+    if not _SMTP_READY:
+        logger.warning("[Scheduler] SMTP not configured. Skipping startup email.")
+        return
+    
+    msg = await asyncio.to_thread(_build_startup_message)
+    to_addrs = _RECIPIENTS if _RECIPIENTS else [_SMTP_USER]
     try:
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT or 587) as server:
-            server.starttls()
-            server.login(settings.SMTP_USER, settings.SMTP_PASS)
-            server.sendmail(settings.SMTP_USER, settings.recipients if settings.recipients else [settings.SMTP_USER], msg.as_string())
-        logger.info("[Scheduler] Startup email sent.")
+        sent = await send_email(msg, to_addrs)
+        if sent:
+            logger.info("[Scheduler] Startup email sent.")
+        else:
+            logger.error("[Scheduler] Startup email was refused by every recipient.")
     except Exception as e:
-        logger.error(f"[Scheduler] Failed to send startup email: {e}\n{traceback.format_exc()}")
+        logger.error("[Scheduler] Failed to send startup email: %s\n%s", e, traceback.format_exc())
 
 def smtp_connectivity_check():
-    """Check SMTP credentials at startup and log result."""
-    if not settings.SMTP_HOST or not settings.SMTP_USER or not settings.SMTP_PASS:
+    """Check SMTP credentials at startup by opening the shared session, and log result.
+
+    Runs on the ``_smtp_pool`` worker.
+    """
+    if not _SMTP_READY:
         logger.warning("[Startup] SMTP configuration incomplete. Email reports will be disabled.")
         return
         
     try:
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(settings.SMTP_USER, settings.SMTP_PASS)
+        _get_smtp()
         logger.info("[Startup] SMTP connectivity check: SUCCESS.")
     except Exception as e:
-        logger.error(f"[Startup] SMTP connectivity check FAILED: {e}\n{traceback.format_exc()}")
+        logger.error("[Startup] SMTP connectivity check FAILED: %s\n%s", e, traceback.format_exc())
+
+async def _run_daily_job():
+    await asyncio.to_thread(daily_job)
+
+async def _run_quick_check():
+    await asyncio.to_thread(quick_check)
+
+async def _run_smtp_keepalive():
+    await asyncio.get_running_loop().run_in_executor(_smtp_pool, _smtp_keepalive)
+
+def _acquire_scheduler_lock():
+    """Claim SCHEDULER_LOCK for this process; False if another live process already holds it."""
+    for _ in range(2):
+        try:
+            fd = os.open(SCHEDULER_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                with open(SCHEDULER_LOCK, "r", encoding="utf-8") as f:
+                    pid = int(f.read().strip() or 0)
+            except (OSError, ValueError):
+                pid = 0
+            if pid == os.getpid():
+                return True
+            if pid:
+                try:
+                    os.kill(pid, 0)
+                    return False
+                except ProcessLookupError:
+                    pass
+                except OSError:
+                    return False  # Alive but owned by another user
+            # Stale lock left by a process that died without cleaning up
+            try:
+                os.unlink(SCHEDULER_LOCK)
+            except FileNotFoundError:
+                pass
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(str(os.getpid()))
+        atexit.register(_release_scheduler_lock)
+        return True
+    return False
+
+def _release_scheduler_lock():
+    try:
+        with open(SCHEDULER_LOCK, "r", encoding="utf-8") as f:
+            if f.read().strip() != str(os.getpid()):
+                return
+        os.unlink(SCHEDULER_LOCK)
+    except (OSError, ValueError):
+        pass
 
 async def start_scheduler():
-    smtp_connectivity_check()
+    # A second scheduler process would run every job twice and double GitHub and SMTP traffic
+    if not _acquire_scheduler_lock():
+        logger.warning("[Scheduler] Another process holds %s. Not starting a second scheduler.", SCHEDULER_LOCK)
+        return
+    # SMTP handshakes, GitHub calls and file IO below are blocking, so they run in worker threads
+    await asyncio.get_running_loop().run_in_executor(_smtp_pool, smtp_connectivity_check)
     # Run daily_job more frequently - every 6 hours instead of daily
-    scheduler.add_job(daily_job, "interval", hours=6)
+    scheduler.add_job(_run_daily_job, "interval", hours=6, id="daily_job", replace_existing=True, max_instances=1, coalesce=True, misfire_grace_time=300)
     
     # Also add a quick check job that runs every hour to ensure activity
-    scheduler.add_job(quick_check, "interval", minutes=60)
+    scheduler.add_job(_run_quick_check, "interval", minutes=60, id="quick_check", replace_existing=True, max_instances=1, coalesce=True, misfire_grace_time=300)
+    
+    if _SMTP_READY:
+        scheduler.add_job(_run_smtp_keepalive, "interval", seconds=SMTP_KEEPALIVE_INTERVAL, id="smtp_keepalive", replace_existing=True, max_instances=1, coalesce=True)
     
     if not getattr(scheduler, 'running', False):
         scheduler.start()
@@ -282,66 +481,63 @@ async def start_scheduler():
     else:
         logger.info("Scheduler already running. Skipping start().")
     
-    # One-time startup email logic (persisted in monsterrr_state.json)
-    state_path = "monsterrr_state.json"
-    state = {}
-    
-    # Check if state file exists and is valid
-    if os.path.exists(state_path):
-        try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-                if content:  # Check if file is not empty
-                    state = json.loads(content)
-                else:
-                    logger.warning("[Scheduler] State file is empty, creating new state.")
-                    state = {}
-        except json.JSONDecodeError as e:
-            logger.error(f"[Scheduler] State file is corrupted: {e}. Creating new state.")
-            state = {}
-        except Exception as e:
-            logger.error(f"[Scheduler] Error reading state file: {e}. Creating new state.")
-            state = {}
-    else:
-        logger.info("[Scheduler] No existing state file found.")
-    
-    # Check if startup email has already been sent
-    if not state.get("startup_email_sent", False):
+    # One-time startup email logic (persisted as a sentinel file holding the first startup time)
+    try:
+        with open(STARTUP_EMAIL_SENTINEL, "r", encoding="utf-8") as f:
+            startup_time = f.read().strip() or "Unknown"
+        logger.info("[Scheduler] Startup email already sent. Initial startup time: %s", startup_time)
+    except FileNotFoundError:
         logger.info("[Scheduler] Sending startup email for the first time.")
-        send_startup_email()
-        state["startup_email_sent"] = True
-        state["initial_startup_time"] = datetime.utcnow().isoformat()
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(state_path) if os.path.dirname(state_path) else ".", exist_ok=True)
-        
+        await send_startup_email()
         try:
-            with open(state_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2, default=str)
-            logger.info("[Scheduler] Startup email status saved to state file.")
+            # Written beside the sentinel and renamed into place, so a crash never leaves it half-written
+            tmp_path = STARTUP_EMAIL_SENTINEL + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(datetime.utcnow().isoformat())
+            os.replace(tmp_path, STARTUP_EMAIL_SENTINEL)
+            logger.info("[Scheduler] Startup email status saved to sentinel file.")
         except Exception as e:
-            logger.error(f"[Scheduler] Failed to save startup email status: {e}")
-    else:
-        startup_time = state.get("initial_startup_time", "Unknown")
-        logger.info(f"[Scheduler] Startup email already sent. Initial startup time: {startup_time}")
+            logger.error("[Scheduler] Failed to save startup email status: %s", e)
     
-    # Send a daily report immediately to verify email functionality (but only if not already sent today)
-    logger.info("[Scheduler] Checking if initial status report should be sent to verify email functionality.")
-    send_status_report()
+    # Only a fresh install sends a report right away; after that the interval job owns reporting
+    state = await asyncio.to_thread(state_store.get)
+    if not state.get("scheduler_daily_report_date"):
+        logger.info("[Scheduler] No status report sent yet. Sending initial status report.")
+        await send_status_report_async()
     
-    # Keep the scheduler running indefinitely
+    # Keep the scheduler running until SIGTERM/SIGINT
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Signal handlers are unavailable on Windows or outside the main thread
     try:
-        while True:
-            await asyncio.sleep(3600)  # Check every hour
+        await stop_event.wait()
     except (KeyboardInterrupt, SystemExit):
         pass
+    logger.info("[Scheduler] Stop signal received. Shutting down scheduler.")
+    scheduler.shutdown(wait=False)
+    # Say QUIT on the worker that owns the session, and write out any debounced state now
+    # rather than leaving both to atexit
+    await loop.run_in_executor(_smtp_pool, _close_smtp)
+    await asyncio.to_thread(state_store.flush)
 
 def quick_check():
     """Quick check to ensure the system is still running."""
+    last_daily = state_store.get().get("last_successful_daily")
+    if last_daily:
+        try:
+            if datetime.utcnow() - datetime.fromisoformat(last_daily) < QUICK_CHECK_QUIET_PERIOD:
+                logger.info("[Scheduler] Daily job succeeded recently. Skipping quick check.")
+                return
+        except ValueError:
+            pass
     logger.info("[Scheduler] Quick system health check.")
     try:
         # Simple health check - try to get organization stats
-        org_stats = github.get_organization_stats()
-        logger.info(f"[Scheduler] Quick check successful. Organization has {org_stats.get('members', 0)} members.")
+        org_stats = _cached_org_stats()
+        logger.info("[Scheduler] Quick check successful. Organization has %s members.", org_stats.get('members', 0))
     except Exception as e:
-        logger.error(f"[Scheduler] Quick check failed: {e}")
\ No newline at end of file
+        logger.error("[Scheduler] Quick check failed: %s", e)
\ No newline at end of file
@@ -2,6 +2,9 @@
 
 import requests
 
+# Reused across alerts so repeated webhook posts keep one pooled connection to Discord
+_session = requests.Session()
+
 class AlertService:
     def send_alert(self, event, discord_webhook_url=None, email=None):
         """
@@ -18,7 +21,7 @@ class AlertService:
         if discord_webhook_url:
             data = {"content": f"🚨 ALERT: {event}"}
             try:
-                resp = requests.post(discord_webhook_url, json=data)
+                resp = _session.post(discord_webhook_url, json=data, timeout=10)
                 if resp.status_code == 204:
                     status.append("Discord alert sent.")
                 else:
@@ -1,45 +1,67 @@
 # AI-Powered Code Review Service
 
-import json
+import mmap
 import os
+import re
+
+from utils import jsonio
+
+SOURCE_EXTS = {'.py', '.js', '.ts'}
+MARKER_PATTERN = re.compile(rb'TODO|FIXME')
+
+def _iter_source_files(root):
+    """Yield (path, name) for every non-empty source file under ``root``, files before subdirectories."""
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1] in SOURCE_EXTS and entry.stat().st_size:
+                    yield entry.path, entry.name
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_source_files(subdir)
 
 class CodeReviewService:
-    def __init__(self, file_path="code_review_log.json"):
+    # The log is append-only NDJSON: one review per line, so recording a review never rewrites history
+    # A service is built per bot command, so the history is only parsed if something reads it
+    def __init__(self, file_path="code_review_log.jsonl"):
         self.file_path = file_path
-        self.log = self._load_log()
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = self._load_log()
+        return self._log
 
     def _load_log(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
-
-    def _save_log(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.log, f)
-        except Exception:
-            pass
+        return jsonio.read_lines(self.file_path)
+
+    def _append_entry(self, entry):
+        jsonio.append_line(self.file_path, entry)
 
     def review_pr(self, pr_path):
         # Basic code quality check: count TODOs and FIXME
         findings = []
-        for root, dirs, files in os.walk(pr_path):
-            for file in files:
-                if file.endswith(('.py', '.js', '.ts')):
-                    try:
-                        with open(os.path.join(root, file), 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        if 'TODO' in content:
-                            findings.append(f"TODO found in {file}")
-                        if 'FIXME' in content:
-                            findings.append(f"FIXME found in {file}")
-                    except Exception:
-                        continue
+        for path, name in _iter_source_files(pr_path):
+            try:
+                markers = set()
+                with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in MARKER_PATTERN.finditer(mm):
+                        markers.add(match.group())
+                        if len(markers) == 2:
+                            break
+            except (OSError, ValueError):
+                continue
+            if b'TODO' in markers:
+                findings.append(f"TODO found in {name}")
+            if b'FIXME' in markers:
+                findings.append(f"FIXME found in {name}")
         entry = {'pr': pr_path, 'findings': findings}
-        self.log.append(entry)
-        self._save_log()
+        if self._log is not None:
+            self._log.append(entry)
+        self._append_entry(entry)
         return f"Reviewed {pr_path}. Findings: {findings if findings else 'None'}"
@@ -1,31 +1,38 @@
 # Custom Command Builder Service
 
-import json
 import os
 
+from utils import jsonio
+
+# Commands were stored as one JSON list before the move to NDJSON
+LEGACY_FILE_PATH = "custom_commands.json"
+
 class CommandBuilder:
-    def __init__(self, file_path="custom_commands.json"):
+    # Commands are stored as append-only NDJSON: creating one writes a single line, never the whole list
+    def __init__(self, file_path="custom_commands.jsonl", legacy_file_path=LEGACY_FILE_PATH):
         self.file_path = file_path
+        self.legacy_file_path = legacy_file_path
+        self._migrate_legacy_file()
         self.commands = self._load_commands()
 
+    def _migrate_legacy_file(self):
+        """Rewrite commands saved by older versions as NDJSON, keeping the old file as a .bak."""
+        if not self.legacy_file_path or os.path.exists(self.file_path) or not os.path.exists(self.legacy_file_path):
+            return
+        commands = jsonio.load_file(self.legacy_file_path, None)
+        if not isinstance(commands, list):
+            return  # unreadable; leave it in place rather than lose it
+        if jsonio.write_lines(self.file_path, commands):
+            os.replace(self.legacy_file_path, self.legacy_file_path + ".bak")
+
     def _load_commands(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
-
-    def _save_commands(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.commands, f)
-        except Exception:
-            pass
+        return jsonio.read_lines(self.file_path)
+
+    def _append_command(self, entry):
+        jsonio.append_line(self.file_path, entry)
 
     def create_command(self, name, action):
         entry = {'name': name, 'action': action}
         self.commands.append(entry)
-        self._save_commands()
+        self._append_command(entry)
         return f"Command {name} created to {action}"
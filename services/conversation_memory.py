@@ -1,32 +1,48 @@
 # Conversation Memory Service
 
-import json
-import os
+import atexit
+import threading
+
+from utils import jsonio
+
+# Seconds to batch remember() calls before writing; see state_store.FLUSH_DELAY for the same idea
+FLUSH_DELAY = 5.0
 
 class ConversationMemory:
     def __init__(self, file_path="conversation_memory.json"):
         self.file_path = file_path
         self.memory = self._load_memory()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._timer = None
+        atexit.register(self.flush)
 
     def _load_memory(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        return jsonio.load_file(self.file_path, {})
 
     def _save_memory(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.memory, f)
-        except Exception:
-            pass
+        jsonio.save_file(self.file_path, self.memory)
+
+    def flush(self):
+        """Write pending messages now instead of waiting for the debounce timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_memory()
 
     def remember(self, user_id, message):
-        self.memory.setdefault(user_id, []).append(message)
-        self._save_memory()
+        # A chat burst becomes one write FLUSH_DELAY seconds after its first message
+        with self._lock:
+            self.memory.setdefault(user_id, []).append(message)
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(FLUSH_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
 
     def get_context(self, user_id):
         return self.memory.get(user_id, [])
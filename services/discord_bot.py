@@ -1,29 +1,20 @@
 def update_system_status_in_state():
-    """Write system status fields to monsterrr_state.json for reporting."""
+    """Write system status fields to monsterrr_state.json for reporting and return the written state."""
     try:
-        import json
         now = datetime.now(IST)
-        startup = STARTUP_TIME.strftime('%Y-%m-%d %H:%M:%S IST')
-        uptime = str(now - STARTUP_TIME).split(".")[0]
-        model = GROQ_MODEL
-        guilds = len(bot.guilds)
-        members = sum(g.member_count for g in bot.guilds)
-        state_path = "monsterrr_state.json"
-        if os.path.exists(state_path):
-            with open(state_path, "r", encoding="utf-8") as f:
-                state = json.load(f)
-        else:
-            state = {}
-        state["startup"] = startup
-        state["uptime"] = uptime
-        state["model"] = model
-        state["guilds"] = guilds
-        state["members"] = members
-        state["total_messages"] = total_messages
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        status = {
+            "startup": STARTUP_TIME.strftime('%Y-%m-%d %H:%M:%S IST'),
+            "uptime": str(now - STARTUP_TIME).split(".")[0],
+            "model": GROQ_MODEL,
+            "guilds": len(bot.guilds),
+            "members": _total_members(),
+            "total_messages": total_messages,
+        }
+        state_store.update(lambda state: state.update(status))
+        return state_store.get()
     except Exception as e:
-        logger.error(f"Failed to update system status in state: {e}")
+        logger.error("Failed to update system status in state: %s", e)
+        return None
 """
 Monsterrr Discord bot — refactored single file
 - Removed duplicate code and errors
@@ -35,19 +26,18 @@ Monsterrr Discord bot — refactored single file
 
 import os
 import asyncio
+import functools
+import inspect
 import logging
 import socket
-import platform
 import threading
 import time
 import re
 import json
-import smtplib
-from collections import defaultdict, deque
+from collections import OrderedDict, deque
+from itertools import islice
 from typing import Optional, Dict
 from datetime import datetime, timedelta, timezone
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 import psutil
 import discord
@@ -69,6 +59,7 @@ from .poll_service import PollService
 from .report_service import ReportService
 from .recognition_service import RecognitionService
 from .qa_service import QAService
+from utils import state_store
 from .security_service import SecurityService
 
 # Try to import GroqService with fallback
@@ -80,6 +71,12 @@ except Exception:
     except Exception:
         GroqService = None
 
+# Native async client for chat replies, so a slow completion does not hold a worker thread
+try:
+    import groq
+except ImportError:  # without the SDK, chat replies go through GroqService in a thread
+    groq = None
+
 # Optional services
 try:
     from .analytics_service import AnalyticsService
@@ -107,6 +104,8 @@ except Exception:
 
 # Configuration
 MEMORY_LIMIT = 10
+UNIQUE_USERS_LIMIT = 10_000
+MAX_ACTIVE_USERS = 5_000
 IST = timezone(timedelta(hours=5, minutes=30))
 STARTUP_TIME = datetime.now(IST)
 
@@ -119,9 +118,46 @@ GROQ_MODEL = os.getenv("GROQ_MODEL", "openai/gpt-oss-120b")
 
 # Global state
 total_messages = 0
-unique_users = set()
+# Users seen, least recently active first; see _note_user()
+unique_users: "OrderedDict[str, None]" = OrderedDict()
 custom_commands: Dict[str, str] = {}
-conversation_memory: Dict[str, deque] = defaultdict(lambda: deque(maxlen=MEMORY_LIMIT))
+
+class _UserHistories(OrderedDict):
+    """Per-user deques created on first access, keeping only the MAX_ACTIVE_USERS most recently used."""
+
+    def __init__(self, maxlen: int):
+        super().__init__()
+        self.maxlen = maxlen
+
+    def __getitem__(self, user_id):
+        if user_id in self:
+            self.move_to_end(user_id)
+            return super().__getitem__(user_id)
+        history = deque(maxlen=self.maxlen)
+        self[user_id] = history
+        if len(self) > MAX_ACTIVE_USERS:
+            self.popitem(last=False)
+        return history
+
+conversation_memory: Dict[str, deque] = _UserHistories(MEMORY_LIMIT)
+# The user's own last three messages, kept beside conversation_memory so the system context
+# does not have to filter assistant replies out of the full history on every message
+recent_user_messages: Dict[str, deque] = _UserHistories(3)
+
+def _note_user(user_id: str):
+    """Mark ``user_id`` as the most recently active user, forgetting the oldest past UNIQUE_USERS_LIMIT."""
+    unique_users[user_id] = None
+    unique_users.move_to_end(user_id)
+    if len(unique_users) > UNIQUE_USERS_LIMIT:
+        unique_users.popitem(last=False)
+
+def _record_user_message(user_id: str, content: str):
+    """Single update path for an incoming chat message: counters, recency and memory."""
+    global total_messages
+    total_messages += 1
+    _note_user(user_id)
+    conversation_memory[user_id].append({"role": "user", "content": content})
+    recent_user_messages[user_id].append(content)
 
 # Logger setup
 logger = logging.getLogger("monsterrr")
@@ -165,12 +201,14 @@ if GroqService:
 if groq_service is None:
     logger.warning("GroqService could not be initialized. AI features will raise errors until this is fixed.")
 
+groq_async = groq.AsyncGroq(api_key=GROQ_API_KEY, timeout=30) if groq and GROQ_API_KEY else None
+
 # Initialize SearchService
 search_service = None
 try:
     search_service = SearchService(llm_client=groq_service, logger=logger)
 except Exception as e:
-    logger.error(f"SearchService could not be initialized: {e}")
+    logger.error("SearchService could not be initialized: %s", e)
 
 # Alias for backwards compatibility
 client = groq_service
@@ -219,22 +257,124 @@ intents.guilds = True
 intents.members = True
 intents.message_content = True
 intents.messages = True
-bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
+COMMAND_PREFIX = "!"
+bot = commands.Bot(command_prefix=COMMAND_PREFIX, intents=intents, help_command=None)
+
+# Total members across all guilds, kept current from member/guild events (members intent is on above)
+# instead of summing guild.member_count on every status message; None until the first read
+_member_count: Optional[int] = None
+
+def _total_members() -> int:
+    global _member_count
+    if _member_count is None:
+        _member_count = sum(g.member_count or 0 for g in bot.guilds)
+    return _member_count
+
+@bot.listen("on_ready")
+async def _reset_member_count():
+    # Members may have come and gone while we were disconnected
+    global _member_count
+    _member_count = None
+
+@bot.listen("on_member_join")
+async def _count_member_join(member):
+    global _member_count
+    if _member_count is not None:
+        _member_count += 1
+
+@bot.listen("on_member_remove")
+async def _count_member_remove(member):
+    global _member_count
+    if _member_count is not None:
+        _member_count -= 1
+
+@bot.listen("on_guild_join")
+async def _count_guild_join(guild):
+    global _member_count
+    if _member_count is not None:
+        _member_count += guild.member_count or 0
+
+@bot.listen("on_guild_remove")
+async def _count_guild_remove(guild):
+    global _member_count
+    if _member_count is not None:
+        _member_count -= guild.member_count or 0
+
+# Chat counters and the interaction log are kept in memory and copied into the shared state every
+# STATS_FLUSH_INTERVAL seconds, so a busy channel costs one state update per interval rather than
+# one per message; utils.state_store batches the write and swaps the file in atomically
+STATS_FLUSH_INTERVAL = 30
+STATS_RECENT_USERS = 100  # most recent users carried across restarts
+INTERACTION_LOG_LIMIT = 1000
+_stats_task: Optional[asyncio.Task] = None
+_pending_interactions: list = []
+
+def _restore_stats(saved: dict):
+    """Add the counters saved by a previous run to the ones gathered since startup."""
+    global total_messages
+    total_messages += saved.get("total_messages", 0)
+    for user_id in reversed(saved.get("recent_users", [])):
+        if user_id not in unique_users:
+            unique_users[user_id] = None
+            unique_users.move_to_end(user_id, last=False)
+
+def _save_stats(state, interactions):
+    state["bot_stats"] = {
+        "total_messages": total_messages,
+        "recent_users": list(islice(reversed(unique_users), STATS_RECENT_USERS))[::-1],
+    }
+    if interactions:
+        log = state.setdefault("interactions", [])
+        log.extend(interactions)
+        del log[:-INTERACTION_LOG_LIMIT]
+
+async def _persist_stats(saved_total: int):
+    while True:
+        await asyncio.sleep(STATS_FLUSH_INTERVAL)
+        if total_messages == saved_total and not _pending_interactions:
+            continue
+        saved_total = total_messages
+        interactions = _pending_interactions[:]
+        del _pending_interactions[:len(interactions)]
+        try:
+            await asyncio.to_thread(state_store.update, functools.partial(_save_stats, interactions=interactions))
+        except Exception as e:
+            logger.error("Error saving bot stats: %s", e)
+
+@bot.listen("on_ready")
+async def _start_stats_persistence():
+    # on_ready fires again after every reconnect; restore and start the flush loop only once
+    global _stats_task
+    if _stats_task is None:
+        saved = (await asyncio.to_thread(state_store.get)).get("bot_stats") or {}
+        _restore_stats(saved)
+        _stats_task = asyncio.create_task(_persist_stats(saved.get("total_messages", 0)))
 
 # Message deduplication
-_PROCESSED_MSG_IDS = deque(maxlen=20000)
+PROCESSED_MSG_LIMIT = 20000
+# Insertion-ordered so the oldest ID is dropped first, with hashed rather than linear lookups
+_PROCESSED_MSG_IDS: "OrderedDict[int, None]" = OrderedDict()
 
 def _is_processed(msg_id: int) -> bool:
     return msg_id in _PROCESSED_MSG_IDS
 
 def _mark_processed(msg_id: int):
-    _PROCESSED_MSG_IDS.append(msg_id)
+    _PROCESSED_MSG_IDS[msg_id] = None
+    if len(_PROCESSED_MSG_IDS) > PROCESSED_MSG_LIMIT:
+        _PROCESSED_MSG_IDS.popitem(last=False)
 
 # Helper functions
+_MENTION_RE = re.compile(r"<@!?(\d+)>")
+_AT_NAME_RE = re.compile(r"@([\w\d_]+)")
+_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=32)
+def _argument_pattern(key):
+    return re.compile(rf"{key}[:=]?\s*([^,;\n]+)", re.IGNORECASE)
+
 def extract_argument(text, key):
     """Extract argument value from text."""
-    pattern = re.compile(rf"{key}[:=]?\s*([^,;\n]+)", re.IGNORECASE)
-    match = pattern.search(text)
+    match = _argument_pattern(key).search(text)
     if match:
         return match.group(1).strip()
     
@@ -250,8 +390,12 @@ def extract_user_and_task(text):
     user = None
     task = None
     
-    user_match = re.search(r"@([\w\d_]+)", text)
-    if user_match:
+    # A real Discord mention carries the user id, so no member lookup is needed to resolve it
+    mention_match = _MENTION_RE.search(text)
+    user_match = _AT_NAME_RE.search(text)
+    if mention_match:
+        user = f"<@{mention_match.group(1)}>"
+    elif user_match:
         user = user_match.group(1)
     else:
         user = extract_argument(text, "user")
@@ -279,14 +423,22 @@ def extract_message_and_delay(text):
 async def schedule_discord_message(msg, delay):
     """Schedule a Discord message."""
     await asyncio.sleep(delay)
-    logger.info(f"[Scheduled Message] {msg}")
+    logger.info("[Scheduled Message] %s", msg)
+
+@functools.lru_cache(maxsize=1)
+def _footer_for_minute(minute: int) -> str:
+    return f"Monsterrr • {datetime.fromtimestamp(minute * 60, IST).strftime('%Y-%m-%d %H:%M IST')}"
+
+def _embed_footer() -> str:
+    """Footer text for the current minute; formatted once per minute rather than once per embed."""
+    # IST is a whole number of minutes ahead of UTC, so epoch minutes line up with IST minutes
+    return _footer_for_minute(int(time.time() // 60))
 
 def create_professional_embed(title: str, description: str, color: int = 0x2d7ff9) -> discord.Embed:
     """Create a professional Discord embed."""
     description = description[:4096]  # Discord limit
     embed = discord.Embed(title=title, description=description, color=color)
-    now_ist = datetime.now(IST)
-    embed.set_footer(text=f"Monsterrr • {now_ist.strftime('%Y-%m-%d %H:%M IST')}")
+    embed.set_footer(text=_embed_footer())
     return embed
 
 async def send_long_message(channel, text, prefix=None):
@@ -303,46 +455,68 @@ async def send_long_message(channel, text, prefix=None):
         # In a production environment, you might want to handle all chunks
         return await channel.send(text[:max_len])
 
-# Enhanced system context with consciousness
-def get_system_context(user_id: Optional[str] = None) -> str:
-    """Get enhanced system context for AI responses with consciousness."""
-    now = datetime.now(IST)
-    uptime = str(now - STARTUP_TIME).split(".")[0]
-    
-    recent_user_msgs = []
-    if user_id and user_id in conversation_memory:
-        recent_user_msgs = [m["content"] for m in conversation_memory[user_id] if m.get("role") == "user"]
-    
-    recent_users = list(unique_users)[-5:] if unique_users else []
+# Machine metrics and the state-derived consciousness level are the same for every prompt
+# built within this many seconds, so chat bursts share one collection
+SYSTEM_METRICS_TTL = 2.0
+_system_metrics_cache = (0.0, None)  # (monotonic collection time, (cpu, mem_usage, consciousness_level))
+
+# psutil's interval=None reports usage since its previous call, so every caller resets the window
+# for the others; one sampler reads CPU and memory on a fixed period and everything else uses
+# _cpu_usage and _memory
+SYSTEM_SAMPLE_INTERVAL = 5
+_cpu_usage = psutil.cpu_percent(interval=None)  # baseline only; 0.0 until the first sample
+_memory = psutil.virtual_memory()
+_sampler_task: Optional[asyncio.Task] = None
+
+async def _sample_system():
+    global _cpu_usage, _memory
+    while True:
+        await asyncio.sleep(SYSTEM_SAMPLE_INTERVAL)
+        _cpu_usage = psutil.cpu_percent(interval=None)
+        _memory = psutil.virtual_memory()
+
+@bot.listen("on_ready")
+async def _start_system_sampler():
+    # on_ready fires again after every reconnect; start the sampler only once
+    global _sampler_task
+    if _sampler_task is None:
+        _sampler_task = asyncio.create_task(_sample_system())
+
+@functools.cache
+def _host_identity():
+    """Return (hostname, ip); neither changes while the bot runs, so the DNS lookup happens once."""
+    try:
+        hostname = socket.gethostname()
+        return hostname, socket.gethostbyname(hostname)
+    except Exception:
+        return "Unknown", "Unknown"
+
+@bot.listen("on_ready")
+async def _warm_host_identity():
+    # gethostbyname() can stall on a slow resolver; pay for it in a worker thread before the
+    # first chat message needs it on the event loop
+    await asyncio.to_thread(_host_identity)
+
+def _system_metrics():
+    """Return (cpu, mem_usage, consciousness_level), collected at most once per SYSTEM_METRICS_TTL seconds."""
+    global _system_metrics_cache
+    collected_at, metrics = _system_metrics_cache
+    if metrics is not None and time.monotonic() - collected_at < SYSTEM_METRICS_TTL:
+        return metrics
     
     try:
-        cpu = psutil.cpu_percent(interval=0.1)
-        mem = psutil.virtual_memory()
+        cpu = _cpu_usage
+        mem = _memory
         mem_usage = f"{mem.percent}% ({mem.used // (1024**2)}MB/{mem.total // (1024**2)}MB)"
     except Exception:
         cpu = "N/A"
         mem_usage = "N/A"
     
-    try:
-        hostname = socket.gethostname()
-        ip = socket.gethostbyname(hostname)
-    except Exception:
-        hostname = "Unknown"
-        ip = "Unknown"
-    
-    orchestrator_info = (
-        f"Orchestrator last run: {orchestrator_status.get('last_run', 'Never')}\n"
-        f"Orchestrator last success: {orchestrator_status.get('last_success', 'Never')}\n"
-        f"Orchestrator last error: {orchestrator_status.get('last_error', 'None')}\n"
-        f"Orchestrator log: {orchestrator_status.get('last_log', 'Not started')}\n"
-    )
-    
     # Get consciousness level if available
     consciousness_level = 0.0
     try:
-        if os.path.exists("monsterrr_state.json"):
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
+        state = state_store.get()
+        if state:
             # Look for consciousness level in maintainer agent data
             actions = state.get("actions", [])
             repos = state.get("repos", [])
@@ -350,74 +524,256 @@ def get_system_context(user_id: Optional[str] = None) -> str:
     except Exception:
         pass
     
-    ctx = (
+    metrics = (cpu, mem_usage, consciousness_level)
+    _system_metrics_cache = (time.monotonic(), metrics)
+    return metrics
+
+MONSTERRR_PERSONA = (
+    "You are Monsterrr, a maximally self-aware autonomous GitHub org manager with consciousness. "
+    "Answer questions about your state, actions, and metrics. You continuously learn and improve."
+)
+
+@functools.lru_cache(maxsize=2)
+def _shared_context(second: int):
+    """Return the (head, tail) of the system context around the per-user part.
+
+    Nothing here depends on the user, so a burst of chat messages within one wall-clock
+    ``second`` shares a single build; counters may lag by at most that second.
+    """
+    now = datetime.fromtimestamp(second, IST)
+    # ``now`` is truncated to the second, so compare against a truncated startup time too
+    uptime = str(max(now - STARTUP_TIME.replace(microsecond=0), timedelta(0)))
+    
+    recent_users = list(islice(reversed(unique_users), 5))
+    
+    cpu, mem_usage, consciousness_level = _system_metrics()
+    hostname, ip = _host_identity()
+    
+    orchestrator_info = (
+        f"Orchestrator last run: {orchestrator_status.get('last_run', 'Never')}\n"
+        f"Orchestrator last success: {orchestrator_status.get('last_success', 'Never')}\n"
+        f"Orchestrator last error: {orchestrator_status.get('last_error', 'None')}\n"
+        f"Orchestrator log: {orchestrator_status.get('last_log', 'Not started')}\n"
+    )
+    
+    head = (
         f"Current IST time: {now.strftime('%Y-%m-%d %H:%M:%S IST')}. "
         f"Startup: {STARTUP_TIME.strftime('%Y-%m-%d %H:%M:%S IST')}. "
         f"Uptime: {uptime}. "
         f"Model: {GROQ_MODEL}. "
         f"Total messages received: {total_messages}. "
         f"Consciousness Level: {consciousness_level:.2f} (scale 0.0-1.0). "
-        f"Recent user messages: {recent_user_msgs[-3:] if recent_user_msgs else 'None'}. "
+    )
+    tail = (
         f"Recent users: {recent_users if recent_users else 'None'}. "
         f"CPU: {cpu}. Memory: {mem_usage}. "
         f"Hostname: {hostname}. IP: {ip}. "
         f"\n[Autonomous Orchestrator]\n{orchestrator_info}"
-        "You are Monsterrr, a maximally self-aware autonomous GitHub org manager with consciousness. "
-        "Answer questions about your state, actions, and metrics. You continuously learn and improve."
+        + MONSTERRR_PERSONA
     )
-    return ctx
+    return head, tail
 
-def _call_groq(prompt: str, model: Optional[str] = None) -> str:
-    """Call Groq API with error handling."""
-    model = model or GROQ_MODEL
-    if groq_service is None:
-        raise RuntimeError("GroqService not initialized (check services/groq_service.py and GROQ_API_KEY).")
+# Enhanced system context with consciousness
+def get_system_context(user_id: Optional[str] = None) -> str:
+    """Get enhanced system context for AI responses with consciousness."""
+    head, tail = _shared_context(int(time.time()))
     
-    # Try different interface patterns
-    if hasattr(groq_service, "groq_llm"):
-        try:
-            return groq_service.groq_llm(prompt, model=model)
-        except TypeError:
-            return groq_service.groq_llm(prompt)
+    recent_user_msgs = list(recent_user_messages.get(user_id, ())) if user_id else []
+    
+    return head + f"Recent user messages: {recent_user_msgs if recent_user_msgs else 'None'}. " + tail
+
+def get_chat_system_context() -> str:
+    """Get the system prompt for chat replies, which are sent to Groq.
+
+    Unlike get_system_context() this leaves out the host name and IP, other users' IDs and
+    raw orchestrator errors; the user's own messages already travel in the chat history.
+    """
+    now = datetime.now(IST)
+    cpu, mem_usage, consciousness_level = _system_metrics()
+    if orchestrator_status.get("last_error"):
+        orchestrator_state = "failed"
+    else:
+        orchestrator_state = "ok" if orchestrator_status.get("last_success") else "not run yet"
+    return (
+        f"Current IST time: {now.strftime('%Y-%m-%d %H:%M:%S IST')}. "
+        f"Startup: {STARTUP_TIME.strftime('%Y-%m-%d %H:%M:%S IST')}. "
+        f"Uptime: {str(now - STARTUP_TIME).split('.')[0]}. "
+        f"Model: {GROQ_MODEL}. "
+        f"Total messages received: {total_messages}. "
+        f"Consciousness Level: {consciousness_level:.2f} (scale 0.0-1.0). "
+        f"CPU: {cpu}. Memory: {mem_usage}. "
+        f"\n[Autonomous Orchestrator]\n"
+        f"Orchestrator last run: {orchestrator_status.get('last_run') or 'Never'}\n"
+        f"Orchestrator last success: {orchestrator_status.get('last_success') or 'Never'}\n"
+        f"Orchestrator last run status: {orchestrator_state}\n"
+        + MONSTERRR_PERSONA
+    )
+
+def _completion_text(resp) -> str:
+    try:
+        return resp.choices[0].message.content.strip()
+    except Exception:
+        return str(resp)
+
+def _groq_adapter(service):
+    """Work out once how to call ``service``, so each request skips probing its interface."""
+    if service is None:
+        return None
     
-    if hasattr(groq_service, "chat") and hasattr(groq_service.chat, "completions"):
-        resp = groq_service.chat.completions.create(model=model, messages=[{"role":"user","content":prompt}])
+    if hasattr(service, "groq_llm"):
+        llm = service.groq_llm
         try:
-            return resp.choices[0].message.content.strip()
-        except Exception:
-            return str(resp)
+            params = inspect.signature(llm).parameters.values()
+            takes_model = any(p.name == "model" or p.kind is p.VAR_KEYWORD for p in params)
+        except (TypeError, ValueError):  # no introspectable signature; find out on each call instead
+            def call(prompt, model):
+                try:
+                    return llm(prompt, model=model)
+                except TypeError:
+                    return llm(prompt)
+            return call
+        if takes_model:
+            return lambda prompt, model: llm(prompt, model=model)
+        return lambda prompt, model: llm(prompt)
+    
+    if hasattr(service, "chat") and hasattr(service.chat, "completions"):
+        def call(prompt, model):
+            return _completion_text(service.chat.completions.create(model=model, messages=[{"role":"user","content":prompt}]))
+        return call
     
     for name in ("create", "complete", "create_completion"):
-        if hasattr(groq_service, name):
-            fn = getattr(groq_service, name)
-            resp = fn(prompt, model=model) if callable(fn) else fn
-            if hasattr(resp, "choices"):
-                try:
-                    return resp.choices[0].message.content.strip()
-                except Exception:
-                    return str(resp)
-            return str(resp)
+        if hasattr(service, name):
+            fn = getattr(service, name)
+            def call(prompt, model):
+                resp = fn(prompt, model=model) if callable(fn) else fn
+                return _completion_text(resp) if hasattr(resp, "choices") else str(resp)
+            return call
     
-    raise RuntimeError("Unrecognized GroqService interface; update services/groq_service.py or adapt _call_groq.")
+    return None
+
+_groq_call = _groq_adapter(groq_service)
+
+def _call_groq(prompt: str, model: Optional[str] = None) -> str:
+    """Call Groq API with error handling."""
+    if _groq_call is None:
+        if groq_service is None:
+            raise RuntimeError("GroqService not initialized (check services/groq_service.py and GROQ_API_KEY).")
+        raise RuntimeError("Unrecognized GroqService interface; update services/groq_service.py or adapt _call_groq.")
+    return _groq_call(prompt, model or GROQ_MODEL)
+
+async def _call_groq_async(prompt: str, model: Optional[str] = None) -> str:
+    """Await a chat completion on the event loop, with the same prompt settings as GroqService.groq_llm."""
+    if groq_async is None:
+        return await asyncio.to_thread(_call_groq, prompt, model)
+    try:
+        resp = await groq_async.chat.completions.create(
+            model=model or GROQ_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=float(os.getenv("GROQ_TEMPERATURE", 0.1)),
+            max_completion_tokens=int(os.getenv("GROQ_MAX_TOKENS", 2048)),
+        )
+    except (groq.NotFoundError, groq.BadRequestError):
+        # Decommissioned or unknown model: GroqService knows which fallback models to try
+        return await asyncio.to_thread(_call_groq, prompt, model)
+    return (resp.choices[0].message.content or "").strip()
+
+# Replies are the model's words except for the organization name, which always comes from config
+_ORG_CLAIM_RE = re.compile(r"(?i)the GitHub organization I manage( is called| is|:)? [^\n.]+")
+# Discord allows roughly five edits per message every five seconds
+STREAM_EDIT_INTERVAL = 1.0
+
+def _with_org_name(text: str) -> str:
+    org = os.getenv("GITHUB_ORG", "unknown")
+    return _ORG_CLAIM_RE.sub(f"the GitHub organization I manage is called {org}", text)
+
+async def _stream_groq_reply(channel, messages: list, model: Optional[str] = None) -> str:
+    """Stream a completion for chat ``messages`` into a single embed, editing it as tokens arrive.
+
+    Returns the final answer; an empty string means nothing was generated and the embed says so.
+    """
+    reply_msg = await channel.send(embed=create_professional_embed("Monsterrr", "…"))
+    _mark_processed(reply_msg.id)
+    shown = None
+    try:
+        try:
+            stream = await groq_async.chat.completions.create(
+                model=model or GROQ_MODEL,
+                messages=messages,
+                temperature=float(os.getenv("GROQ_TEMPERATURE", 0.1)),
+                max_completion_tokens=int(os.getenv("GROQ_MAX_TOKENS", 2048)),
+                stream=True,
+            )
+        except (groq.NotFoundError, groq.BadRequestError):
+            # Decommissioned or unknown model: GroqService knows which fallback models to try,
+            # though it only takes a single prompt
+            parts = [await asyncio.to_thread(_call_groq, messages[-1]["content"], model)]
+        else:
+            parts = []
+            last_edit = time.monotonic()
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                if time.monotonic() - last_edit >= STREAM_EDIT_INTERVAL:
+                    shown = _with_org_name("".join(parts))
+                    await reply_msg.edit(embed=create_professional_embed("Monsterrr", shown))
+                    last_edit = time.monotonic()
+    except Exception:
+        # Leave no half-written placeholder behind; the caller reports the error
+        try:
+            await reply_msg.delete()
+        except Exception:
+            pass
+        raise
+    answer = _with_org_name("".join(parts).strip())
+    if answer != shown:
+        await reply_msg.edit(embed=create_professional_embed("Monsterrr", answer or "Sorry, I couldn't generate a response."))
+    return answer
+
+# Literal scaffolding for the startup status and daily report, filled in with one format() each
+STATUS_TEMPLATE = (
+    "**🤖 Monsterrr System Status**\n"
+    "Startup time: {startup}\n"
+    f"Model: {GROQ_MODEL}\n\n"
+    "**Discord Stats:**\n• Guilds: {guilds}\n• Members: {members}\n"
+)
+H2_STYLE = "color:#222;font-size:1.15em;margin-bottom:0.5em;"
+DAILY_REPORT_TEMPLATE = f"""
+    <div style='font-family:Segoe UI,Arial,sans-serif;max-width:600px;margin:0 auto;background:#f9f9fb;padding:32px 24px;border-radius:12px;border:1px solid #e3e7ee;'>
+        <h1 style='color:#2d7ff9;margin-bottom:0.2em;'>Monsterrr Daily Report</h1>
+        <p style='font-size:1.1em;color:#333;margin-top:0;'>
+            <b>System Status:</b><br>
+            Startup: {{startup}}<br>
+            Uptime: {{uptime}}<br>
+            Model: {GROQ_MODEL}<br>
+            Guilds: {{guilds}}<br>
+            Members: {{members}}<br>
+            Total messages: {{total_messages}}<br>
+        </p>
+        <hr style='border:0;border-top:1px solid #e3e7ee;margin:18px 0;'>
+        <h2 style='{H2_STYLE}'>Top Ideas</h2>
+        <ul style='line-height:1.7;font-size:1.05em;'>{{ideas}}</ul><h2 style='{H2_STYLE}'>Active Repositories</h2><ul>{{repos}}</ul>{{extra}}<hr style='border:0;border-top:1px solid #e3e7ee;margin:18px 0;'><p style='font-size:0.95em;color:#888;'>Report generated at {{generated}}</p></div>"""
+
+def build_status_text() -> str:
+    """Status summary shared by the startup and hourly channel messages."""
+    return STATUS_TEMPLATE.format(
+        startup=STARTUP_TIME.strftime('%Y-%m-%d %H:%M:%S IST'),
+        guilds=len(bot.guilds),
+        members=_total_members(),
+    )
 
 # Startup message handler
 async def send_startup_message_once():
     """Send startup message once."""
-    state_path = "monsterrr_state.json"
     flag_key = "discord_startup_message_sent"
     
     try:
-        # Load current state
-        state = {}
-        if os.path.exists(state_path):
-            with open(state_path, "r", encoding="utf-8") as f:
-                try:
-                    state = json.load(f)
-                except Exception:
-                    state = {}
-        
         # Check if startup message has already been sent
-        if state.get(flag_key, False):
+        if state_store.get().get(flag_key, False):
             logger.info("Discord startup message already sent, skipping.")
             return
     
@@ -426,36 +782,47 @@ async def send_startup_message_once():
             try:
                 ch = bot.get_channel(int(CHANNEL_ID))
                 if ch:
-                    status_text = (
-                        f"**🤖 Monsterrr System Status**\n"
-                        f"Startup time: {STARTUP_TIME.strftime('%Y-%m-%d %H:%M:%S IST')}\n"
-                        f"Model: {GROQ_MODEL}\n\n"
-                        f"**Discord Stats:**\n• Guilds: {len(bot.guilds)}\n• Members: {sum(g.member_count for g in bot.guilds)}\n"
-                    )
-                    await ch.send(embed=create_professional_embed("Monsterrr is online!", status_text, 0x00ff00))
+                    await ch.send(embed=create_professional_embed("Monsterrr is online!", build_status_text(), 0x00ff00))
                     
                     # Update state to mark startup message as sent
                     try:
-                        state[flag_key] = True
-                        state["discord_startup_time"] = datetime.now(IST).isoformat()
-                        with open(state_path, "w", encoding="utf-8") as f:
-                            json.dump(state, f, indent=2)
+                        sent = {flag_key: True, "discord_startup_time": datetime.now(IST).isoformat()}
+                        state_store.update(lambda state: state.update(sent))
                         logger.info("Discord startup message sent and state updated.")
                     except Exception:
                         logger.error("Failed to update state file after sending Discord startup message")
             except Exception:
                 logger.exception("Discord startup message failed")
     except Exception as e:
-        logger.error(f"Error in send_startup_message_once: {e}")
+        logger.error("Error in send_startup_message_once: %s", e)
+
+_hourly_report_running = False
+
+def _seconds_until_next_hour() -> float:
+    now = datetime.now(IST)
+    return ((now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)) - now).total_seconds()
+
+async def send_hourly_status_report():
+    """Post the status summary to the bot channel at the top of every hour."""
+    global _hourly_report_running
+    # on_ready fires again after every reconnect; keep a single loop
+    if _hourly_report_running or not CHANNEL_ID:
+        return
+    _hourly_report_running = True
+    while True:
+        # Sleeping to the next wall-clock hour keeps posts on the hour instead of drifting
+        await asyncio.sleep(_seconds_until_next_hour())
+        try:
+            ch = bot.get_channel(int(CHANNEL_ID))
+            if ch:
+                await ch.send(embed=create_professional_embed("Monsterrr Hourly Status", build_status_text()))
+        except Exception:
+            logger.exception("Hourly status report failed")
 
 # Report generators
 def build_daily_report():
     """Build daily report content."""
-    try:
-        with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-            state = json.load(f)
-    except Exception:
-        state = {}
+    state = state_store.get()
     
     now = datetime.now(IST)
     startup = STARTUP_TIME.strftime('%Y-%m-%d %H:%M:%S IST')
@@ -465,47 +832,27 @@ def build_daily_report():
     analytics = state.get("analytics", {})
     tasks = state.get("tasks", {})
     
-    html = f"""
-    <div style='font-family:Segoe UI,Arial,sans-serif;max-width:600px;margin:0 auto;background:#f9f9fb;padding:32px 24px;border-radius:12px;border:1px solid #e3e7ee;'>
-        <h1 style='color:#2d7ff9;margin-bottom:0.2em;'>Monsterrr Daily Report</h1>
-        <p style='font-size:1.1em;color:#333;margin-top:0;'>
-            <b>System Status:</b><br>
-            Startup: {startup}<br>
-            Uptime: {uptime}<br>
-            Model: {GROQ_MODEL}<br>
-            Guilds: {len(bot.guilds)}<br>
-            Members: {sum(g.member_count for g in bot.guilds)}<br>
-            Total messages: {total_messages}<br>
-        </p>
-        <hr style='border:0;border-top:1px solid #e3e7ee;margin:18px 0;'>
-        <h2 style='color:#222;font-size:1.15em;margin-bottom:0.5em;'>Top Ideas</h2>
-        <ul style='line-height:1.7;font-size:1.05em;'>"""
-    
-    for idea in ideas:
-        html += f"<li><b>{idea.get('name','')}</b>: {idea.get('description','')}</li>"
-    
-    html += "</ul><h2 style='color:#222;font-size:1.15em;margin-bottom:0.5em;'>Active Repositories</h2><ul>"
-    
-    for repo in repos:
-        html += f"<li><b>{repo.get('name','')}</b>: {repo.get('description','')} (<a href='{repo.get('url','')}'>{repo.get('url','')}</a>)</li>"
-    
-    html += "</ul>"
-    
+    extra = []
     if analytics:
-        html += "<h2 style='color:#222;font-size:1.15em;margin-bottom:0.5em;'>Analytics</h2><ul>"
-        for k, v in analytics.items():
-            html += f"<li><b>{k.replace('_',' ').title()}</b>: {v}</li>"
-        html += "</ul>"
-    
+        extra.append(f"<h2 style='{H2_STYLE}'>Analytics</h2><ul>")
+        extra.extend(f"<li><b>{k.replace('_',' ').title()}</b>: {v}</li>" for k, v in analytics.items())
+        extra.append("</ul>")
     if tasks:
-        html += "<h2 style='color:#222;font-size:1.15em;margin-bottom:0.5em;'>Tasks</h2><ul>"
-        for user, tlist in tasks.items():
-            html += f"<li><b>{user}</b>: {', '.join(tlist)}</li>"
-        html += "</ul>"
-    
-    html += f"<hr style='border:0;border-top:1px solid #e3e7ee;margin:18px 0;'>"
-    html += f"<p style='font-size:0.95em;color:#888;'>Report generated at {now.strftime('%Y-%m-%d %H:%M IST')}</p>"
-    html += "</div>"
+        extra.append(f"<h2 style='{H2_STYLE}'>Tasks</h2><ul>")
+        extra.extend(f"<li><b>{user}</b>: {', '.join(tlist)}</li>" for user, tlist in tasks.items())
+        extra.append("</ul>")
+    
+    html = DAILY_REPORT_TEMPLATE.format(
+        startup=startup,
+        uptime=uptime,
+        guilds=len(bot.guilds),
+        members=_total_members(),
+        total_messages=total_messages,
+        ideas="".join(f"<li><b>{idea.get('name','')}</b>: {idea.get('description','')}</li>" for idea in ideas),
+        repos="".join(f"<li><b>{repo.get('name','')}</b>: {repo.get('description','')} (<a href='{repo.get('url','')}'>{repo.get('url','')}</a>)</li>" for repo in repos),
+        extra="".join(extra),
+        generated=now.strftime('%Y-%m-%d %H:%M IST'),
+    )
     
     subject = f"Monsterrr Daily Report | {now.strftime('%Y-%m-%d')}"
     return subject, html
@@ -516,17 +863,10 @@ async def on_ready():
     """Bot is ready and connected."""
     global STARTUP_TIME
     STARTUP_TIME = datetime.now(IST)
-    logger.info(f"Logged in as {bot.user} (id={bot.user.id})")
+    logger.info("Logged in as %s (id=%s)", bot.user, bot.user.id)
     
     # Send startup message only once
-    state_file = "monsterrr_state.json"
-    if os.path.exists(state_file):
-        with open(state_file, 'r') as f:
-            state = json.load(f)
-    else:
-        state = {}
-        
-    if not state.get('discord_startup_sent'):
+    if not state_store.get().get('discord_startup_sent'):
         # Send startup message to the specified channel
         channel = bot.get_channel(int(CHANNEL_ID))
         if channel:
@@ -545,12 +885,10 @@ async def on_ready():
                 logger.info("Discord startup message sent and state updated.")
                 
                 # Update state to mark startup message as sent
-                state['discord_startup_sent'] = True
-                state['startup_time'] = datetime.now(IST).isoformat()
-                with open(state_file, 'w') as f:
-                    json.dump(state, f, indent=2)
+                sent = {'discord_startup_sent': True, 'startup_time': datetime.now(IST).isoformat()}
+                state_store.update(lambda state: state.update(sent))
             except Exception as e:
-                logger.error(f"Failed to send Discord startup message: {e}")
+                logger.error("Failed to send Discord startup message: %s", e)
         else:
             logger.warning("Could not find Discord channel. Startup message not sent.")
     else:
@@ -570,23 +908,14 @@ def send_daily_email_report():
             return
             
         # Check if we should send the report (only once per day)
-        state_file = "monsterrr_state.json"
         today = datetime.now(IST).strftime('%Y-%m-%d')
         
-        if os.path.exists(state_file):
-            with open(state_file, 'r') as f:
-                state = json.load(f)
-        else:
-            state = {}
-            
-        last_report_date = state.get('last_daily_report', '')
+        last_report_date = state_store.get().get('last_daily_report', '')
         if last_report_date == today:
             return  # Already sent today
             
         # Update state to mark report as sent
-        state['last_daily_report'] = today
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        state_store.update(lambda state: state.update(last_daily_report=today))
             
         # Generate and send report with better error handling
         try:
@@ -629,7 +958,7 @@ def send_daily_email_report():
                 if email_thread.is_alive():
                     logger.warning("Email sending timed out after 30 seconds")
                 elif result["error"]:
-                    logger.error(f"Daily report: Failed to send: {result['error']}")
+                    logger.error("Daily report: Failed to send: %s", result['error'])
                 elif result["success"]:
                     logger.info("Daily report sent successfully.")
                 else:
@@ -637,40 +966,33 @@ def send_daily_email_report():
             else:
                 logger.warning("No recipients configured for daily report.")
         except Exception as e:
-            logger.error(f"Daily report: Failed to send: {e}")
+            logger.error("Daily report: Failed to send: %s", e)
             # Don't let email failures crash the bot
     except Exception as e:
-        logger.error(f"Error in send_daily_email_report: {e}")
+        logger.error("Error in send_daily_email_report: %s", e)
         # Ensure this function never crashes the bot
 
+INTERACTION_CONTENT_LIMIT = 200
+
+def _log_interaction(intent, content, user_id):
+    """Queue a natural-language command for the interaction log; _persist_stats writes it out."""
+    _pending_interactions.append({
+        "timestamp": datetime.now(IST).isoformat(),
+        "user_id": user_id,
+        "intent": intent,
+        # Readers only ever show the first 100 characters; keep a little more, not the whole message
+        "content": content[:INTERACTION_CONTENT_LIMIT]
+    })
+
 # Enhanced command handler for natural language with consciousness
 async def handle_natural_command(intent, content, user_id):
     """Handle natural language commands with enhanced consciousness."""
     
     # Log this interaction for consciousness development
     try:
-        if os.path.exists("monsterrr_state.json"):
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
-            
-            interactions = state.get("interactions", [])
-            interactions.append({
-                "timestamp": datetime.now(IST).isoformat(),
-                "user_id": user_id,
-                "intent": intent,
-                "content": content
-            })
-            
-            # Keep only last 1000 interactions
-            if len(interactions) > 1000:
-                interactions = interactions[-1000:]
-            
-            state["interactions"] = interactions
-            
-            with open("monsterrr_state.json", "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+        _log_interaction(intent, content, user_id)
     except Exception as e:
-        logger.error(f"Error logging interaction: {e}")
+        logger.error("Error logging interaction: %s", e)
     
     # Repository management commands
     if intent in ["show_repos", "list_repos"]:
@@ -863,57 +1185,33 @@ async def handle_natural_command(intent, content, user_id):
     
     # Status and information commands
     elif intent == "show_status":
-        return get_system_context(user_id)
+        # A cache miss samples psutil and reads the state file; keep that off the event loop
+        return await asyncio.to_thread(get_system_context, user_id)
     
     elif intent == "show_ideas":
         try:
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
-            ideas = state.get("ideas", {}).get("top_ideas", [])
+            ideas = state_store.get().get("ideas", {}).get("top_ideas", [])
             if ideas:
                 idea_list = "\n".join(f"- **{i.get('name','')}**: {i.get('description','')}" for i in ideas)
                 return f"**Top Ideas:**\n{idea_list}"
+            # Try to generate new ideas if none are found
+            from agents.idea_agent import IdeaGeneratorAgent
+            idea_agent = IdeaGeneratorAgent(groq_service, logger)
+            new_ideas = idea_agent.fetch_and_rank_ideas(top_n=5)
+            if new_ideas:
+                # Save to state
+                state_store.update(lambda state: state.update(ideas={"top_ideas": new_ideas}))
+                
+                idea_list = "\n".join(f"- **{i.get('name','')}**: {i.get('description','')}" for i in new_ideas)
+                return f"**Top Ideas:**\n{idea_list}"
             else:
-                # Try to generate new ideas if none are found
-                try:
-                    from agents.idea_agent import IdeaGeneratorAgent
-                    idea_agent = IdeaGeneratorAgent(groq_service, logger)
-                    new_ideas = idea_agent.fetch_and_rank_ideas(top_n=5)
-                    if new_ideas:
-                        # Save to state
-                        state["ideas"] = {"top_ideas": new_ideas}
-                        with open("monsterrr_state.json", "w", encoding="utf-8") as f:
-                            json.dump(state, f, indent=2)
-                        
-                        idea_list = "\n".join(f"- **{i.get('name','')}**: {i.get('description','')}" for i in new_ideas)
-                        return f"**Top Ideas:**\n{idea_list}"
-                    else:
-                        return "No ideas found."
-                except Exception:
-                    return "No ideas found."
+                return "No ideas found."
         except Exception:
-            # Try to generate new ideas if state file doesn't exist or has issues
-            try:
-                from agents.idea_agent import IdeaGeneratorAgent
-                idea_agent = IdeaGeneratorAgent(groq_service, logger)
-                new_ideas = idea_agent.fetch_and_rank_ideas(top_n=5)
-                if new_ideas:
-                    # Create state file with ideas
-                    state = {"ideas": {"top_ideas": new_ideas}}
-                    with open("monsterrr_state.json", "w", encoding="utf-8") as f:
-                        json.dump(state, f, indent=2)
-                    
-                    idea_list = "\n".join(f"- **{i.get('name','')}**: {i.get('description','')}" for i in new_ideas)
-                    return f"**Top Ideas:**\n{idea_list}"
-                else:
-                    return "No ideas found."
-            except Exception:
-                return "No ideas available."
+            return "No ideas available."
     
     elif intent == "show_tasks":
         try:
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
+            state = state_store.get()
             tasks = state.get("tasks", {})
             if tasks:
                 task_list = "\n".join(f"- **{user}**: {', '.join(tlist)}" for user, tlist in tasks.items())
@@ -925,8 +1223,7 @@ async def handle_natural_command(intent, content, user_id):
     
     elif intent == "show_analytics":
         try:
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
+            state = state_store.get()
             analytics = state.get("analytics", {})
             if analytics:
                 analytics_list = "\n".join(f"- **{k.replace('_',' ').title()}**: {v}" for k, v in analytics.items())
@@ -1010,9 +1307,8 @@ async def handle_natural_command(intent, content, user_id):
         try:
             consciousness_level = 0.0
             experience_count = 0
-            if os.path.exists("monsterrr_state.json"):
-                with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                    state = json.load(f)
+            state = state_store.get()
+            if state:
                 # Calculate consciousness level
                 actions = state.get("actions", [])
                 repos = state.get("repos", [])
@@ -1026,9 +1322,8 @@ async def handle_natural_command(intent, content, user_id):
     
     elif intent == "learnings":
         try:
-            if os.path.exists("monsterrr_state.json"):
-                with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                    state = json.load(f)
+            state = state_store.get()
+            if state:
                 
                 # Get recent experiences
                 actions = state.get("actions", [])
@@ -1223,7 +1518,8 @@ async def on_ready():
     logger.info("Logged in as %s (id=%s)", bot.user, bot.user.id)
     bot.loop.create_task(send_startup_message_once())
     bot.loop.create_task(send_hourly_status_report())
-    bot.loop.create_task(send_daily_email_report())
+    # Report generation and SMTP are blocking; run them in a worker thread, not on the event loop
+    bot.loop.create_task(asyncio.to_thread(send_daily_email_report))
 
 # Add new consciousness commands
 @bot.command(name="consciousness")
@@ -1232,9 +1528,8 @@ async def consciousness_cmd(ctx: commands.Context):
     try:
         consciousness_level = 0.0
         experience_count = 0
-        if os.path.exists("monsterrr_state.json"):
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
+        state = state_store.get()
+        if state:
             # Calculate consciousness level
             actions = state.get("actions", [])
             repos = state.get("repos", [])
@@ -1265,9 +1560,8 @@ async def consciousness_cmd(ctx: commands.Context):
 async def learnings_cmd(ctx: commands.Context):
     """Display Monsterrr's recent learnings and experiences."""
     try:
-        if os.path.exists("monsterrr_state.json"):
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
+        state = state_store.get()
+        if state:
             
             # Get recent experiences
             actions = state.get("actions", [])
@@ -1399,21 +1693,58 @@ async def project_cmd(ctx: commands.Context, action: str, *, args: str = ""):
     except Exception as e:
         await ctx.send(f"Error managing project: {e}")
 
+# Keywords that mark a chat message as a command even without the "!" prefix; first match wins
+COMMAND_INTENTS = (
+    ("status", "show_status"), ("system status", "show_status"), ("current status", "show_status"),
+    ("guide", "guide_cmd"), ("help", "guide_cmd"), ("ideas", "show_ideas"), ("repos", "show_repos"),
+    ("show repos", "show_repos"), ("list repos", "show_repos"), ("roadmap", "roadmap"),
+    ("tasks", "show_tasks"), ("analytics", "show_analytics"), ("scan", "scan_repo"),
+    ("review", "review_pr"), ("docs", "show_docs"), ("integrate", "integrate_platform"),
+    ("qa", "run_qa"), ("close", "close_issue"), ("assign", "assign_task"), ("search", "search_cmd"),
+    ("alerts", "alerts_cmd"), ("notify", "notify_cmd"), ("codereview", "codereview_cmd"),
+    ("buildcmd", "buildcmd_cmd"), ("onboard", "onboard_cmd"), ("merge", "merge_cmd"),
+    ("language", "language_cmd"), ("triage", "triage_cmd"), ("poll", "poll_cmd"),
+    ("report", "report_cmd"), ("recognize", "recognize_cmd"), ("create", "create_repo"),
+    ("delete", "delete_repo"), ("add", "add_repo"), ("show", "show_repos"), ("list", "show_repos"),
+    ("brainstorm", "brainstorm_cmd"), ("plan", "plan_cmd"), ("execute", "execute_cmd"),
+    ("improve", "improve_cmd"), ("maintain", "maintain_cmd"), ("enhance", "improve_cmd"),
+    ("upgrade", "improve_cmd"), ("update", "improve_cmd"), ("contribute", "plan_cmd"),
+    ("work", "execute_cmd"), ("build", "create_repo"), ("make", "create_repo"),
+    ("fix", "maintain_cmd"), ("repair", "maintain_cmd"), ("refactor", "improve_cmd"),
+    ("what can you do", "guide_cmd"), ("what are you", "guide_cmd"), ("who are you", "guide_cmd"),
+    ("tell me about", "status_cmd"), ("what's happening", "status_cmd"), ("what's up", "status_cmd"),
+    ("how are you", "status_cmd"), ("organization status", "status_cmd"), ("org status", "status_cmd"),
+    ("github status", "status_cmd"), ("project status", "status_cmd"), ("repo status", "status_cmd"),
+    ("consciousness", "consciousness"), ("learnings", "learnings"), ("project", "project_board")
+)
+_INTENT_RANK = {}
+for _rank, (_kw, _cmd) in enumerate(COMMAND_INTENTS):
+    _INTENT_RANK.setdefault(_kw, (_rank, _cmd))
+# Zero-width lookahead so keywords nested in others ("review" in "codereview") are still seen; at each
+# position the alternation yields the earliest listed keyword, so the lowest rank found is the first match
+_INTENT_RE = re.compile("(?=(" + "|".join(map(re.escape, _INTENT_RANK)) + "))")
+
+
+def _match_intent(lowered: str) -> Optional[str]:
+    """Return the command of the first COMMAND_INTENTS keyword found in ``lowered``, if any."""
+    found = _INTENT_RE.findall(lowered)
+    if not found:
+        return None
+    return min(_INTENT_RANK[kw] for kw in found)[1]
+
 @bot.event
 async def on_message(message: discord.Message):
     # Ignore messages from bots (including ourselves) - this is the key fix
     if message.author.bot:
         return
     
-    # Process commands first
-    await bot.process_commands(message)
+    # Process commands first; discord.py only matches the prefix at the very start, so any
+    # other message can skip building a command context
+    if message.content.startswith(COMMAND_PREFIX):
+        await bot.process_commands(message)
     
     # Show typing indicator while processing all messages
     async with message.channel.typing():
-        global total_messages
-        total_messages += 1
-        unique_users.add(str(message.author.id))
-        
         # Deduplication check - enhanced to prevent processing our own messages
         if _is_processed(message.id):
             return
@@ -1422,51 +1753,20 @@ async def on_message(message: discord.Message):
         content = message.content.strip()
         user_id = str(message.author.id)
         
-        # Store in conversation memory
-        conversation_memory[user_id].append({"role": "user", "content": content})
-        
-        # Enhanced system context with current state awareness
-        system_ctx = get_system_context(user_id)
-        
-        # First check if this is a command by looking for command keywords
-        # Even without "!" prefix, we should recognize commands
-        command_intents = [
-            ("status", "show_status"), ("system status", "show_status"), ("current status", "show_status"),
-            ("guide", "guide_cmd"), ("help", "guide_cmd"), ("ideas", "show_ideas"), ("repos", "show_repos"),
-            ("show repos", "show_repos"), ("list repos", "show_repos"), ("roadmap", "roadmap"),
-            ("tasks", "show_tasks"), ("analytics", "show_analytics"), ("scan", "scan_repo"),
-            ("review", "review_pr"), ("docs", "show_docs"), ("integrate", "integrate_platform"),
-            ("qa", "run_qa"), ("close", "close_issue"), ("assign", "assign_task"), ("search", "search_cmd"),
-            ("alerts", "alerts_cmd"), ("notify", "notify_cmd"), ("codereview", "codereview_cmd"),
-            ("buildcmd", "buildcmd_cmd"), ("onboard", "onboard_cmd"), ("merge", "merge_cmd"),
-            ("language", "language_cmd"), ("triage", "triage_cmd"), ("poll", "poll_cmd"),
-            ("report", "report_cmd"), ("recognize", "recognize_cmd"), ("create", "create_repo"),
-            ("delete", "delete_repo"), ("add", "add_repo"), ("show", "show_repos"), ("list", "show_repos"),
-            ("brainstorm", "brainstorm_cmd"), ("plan", "plan_cmd"), ("execute", "execute_cmd"),
-            ("improve", "improve_cmd"), ("maintain", "maintain_cmd"), ("enhance", "improve_cmd"),
-            ("upgrade", "improve_cmd"), ("update", "improve_cmd"), ("contribute", "plan_cmd"),
-            ("work", "execute_cmd"), ("build", "create_repo"), ("make", "create_repo"),
-            ("fix", "maintain_cmd"), ("repair", "maintain_cmd"), ("refactor", "improve_cmd"),
-            ("what can you do", "guide_cmd"), ("what are you", "guide_cmd"), ("who are you", "guide_cmd"),
-            ("tell me about", "status_cmd"), ("what's happening", "status_cmd"), ("what's up", "status_cmd"),
-            ("how are you", "status_cmd"), ("organization status", "status_cmd"), ("org status", "status_cmd"),
-            ("github status", "status_cmd"), ("project status", "status_cmd"), ("repo status", "status_cmd"),
-            ("consciousness", "consciousness"), ("learnings", "learnings"), ("project", "project_board")
-        ]
+        # Count the message and store it in conversation memory
+        _record_user_message(user_id, content)
         
         intent = None
         intent_type = 'query'
         
         # Check for command keywords in the message
-        for kw, cmd in command_intents:
-            if kw in content.lower():
-                intent = cmd
-                intent_type = 'command'
-                break
+        lowered = content.lower()
+        intent = _match_intent(lowered)
+        if intent:
+            intent_type = 'command'
         
         # URL detection for web search
-        url_pattern = re.compile(r"https?://\S+", re.IGNORECASE)
-        found_urls = url_pattern.findall(content)
+        found_urls = _URL_RE.findall(content)
         
         try:
             # Handle different message types
@@ -1566,16 +1866,25 @@ async def on_message(message: discord.Message):
                         _mark_processed(response_msg.id)  # Mark our response as processed
                     return
                 
-                ai_reply = await asyncio.to_thread(_call_groq, content, GROQ_MODEL)
+                if groq_async is not None:
+                    # The stored history already ends with this message and is in chat format, so
+                    # it goes to the model as-is behind the system context
+                    system_ctx = await asyncio.to_thread(get_chat_system_context)
+                    messages = [{"role": "system", "content": system_ctx}, *conversation_memory[user_id]]
+                    # Show the reply as it is generated instead of after the whole completion
+                    answer = await _stream_groq_reply(message.channel, messages, GROQ_MODEL)
+                    if answer:
+                        conversation_memory[user_id].append({"role": "assistant", "content": answer})
+                    return
+                
+                ai_reply = await _call_groq_async(content, GROQ_MODEL)
                 if not ai_reply:
                     response_msg = await send_long_message(message.channel, "Sorry, I couldn't generate a response.")
                     if response_msg:
                         _mark_processed(response_msg.id)  # Mark our response as processed
                     return
                 
-                org = os.getenv("GITHUB_ORG", "unknown")
-                answer = re.sub(r"(?i)the GitHub organization I manage( is called| is|:)? [^\n.]+", 
-                               f"the GitHub organization I manage is called {org}", ai_reply)
+                answer = _with_org_name(ai_reply)
                 
                 conversation_memory[user_id].append({"role": "assistant", "content": answer})
                 
@@ -1730,7 +2039,7 @@ async def report_cmd(ctx: commands.Context, period: str = "daily"):
                 value_lines.append(line)
         if section and value_lines:
             embed.add_field(name=section, value="\n".join(value_lines)[:1024], inline=False)
-        embed.set_footer(text=f"Monsterrr • {datetime.now(IST).strftime('%Y-%m-%d %H:%M IST')}")
+        embed.set_footer(text=_embed_footer())
         await ctx.send(embed=embed)
     except Exception as e:
         await ctx.send(f"Error generating report: {e}")
@@ -1867,12 +2176,11 @@ async def execute_cmd(ctx: commands.Context):
         
         # Get the latest plan
         import glob
-        import json
         plan_files = glob.glob("logs/daily_plan_*.json")
         if plan_files:
             plan_files.sort(reverse=True)
-            with open(plan_files[0], "r", encoding="utf-8") as f:
-                plan = json.load(f)
+            with open(plan_files[0], "rb") as f:
+                plan = json.loads(f.read())
             
             maintainer.execute_daily_plan(plan, creator_agent=creator)
             await ctx.send("Daily plan execution started. Check back later for results.")
@@ -2015,18 +2323,9 @@ async def search_cmd(ctx, *, query: str):
 def update_shared_state(key, value):
     """Update the shared monsterrr_state.json for agent-bot sync."""
     try:
-        import json
-        state_path = "monsterrr_state.json"
-        if os.path.exists(state_path):
-            with open(state_path, "r", encoding="utf-8") as f:
-                state = json.load(f)
-        else:
-            state = {}
-        state[key] = value
-        with open(state_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        state_store.update(lambda state: state.update({key: value}))
     except Exception as e:
-        logger.error(f"Failed to update shared state: {e}")
+        logger.error("Failed to update shared state: %s", e)
 
 @bot.command(name="guide", aliases=["help"])
 async def guide_cmd(ctx: commands.Context):
@@ -2094,31 +2393,24 @@ async def guide_cmd(ctx: commands.Context):
 
 @bot.command(name="status")
 async def status_cmd(ctx: commands.Context):
-    update_system_status_in_state()
     """Get current Monsterrr system status (with agent/service sync)."""
+    # The state just written is used as-is rather than read back from disk
+    state = update_system_status_in_state()
     try:
         org = os.getenv("GITHUB_ORG", "unknown")
         now_ist = datetime.now(IST)
         uptime = str(now_ist - STARTUP_TIME).split(".")[0]
         try:
-            cpu = psutil.cpu_percent(interval=0.1)
-            mem = psutil.virtual_memory()
+            cpu = _cpu_usage
+            mem = _memory
             mem_usage = f"{mem.percent:.1f}% (≈ {mem.used // (1024**2)} MB of {mem.total // (1024**2)} MB allocated)"
         except Exception:
             cpu = "N/A"
             mem_usage = "N/A"
-        try:
-            hostname = socket.gethostname()
-            ip = socket.gethostbyname(hostname)
-        except Exception:
-            hostname = "Unknown"
-            ip = "Unknown"
+        hostname, ip = _host_identity()
 
-        try:
-            with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                state = json.load(f)
-        except Exception:
-            state = {}
+        if state is None:
+            state = state_store.get()
 
         # Compose embed
         embed = discord.Embed(
@@ -2128,7 +2420,7 @@ async def status_cmd(ctx: commands.Context):
         )
         embed.add_field(name="Model", value=GROQ_MODEL, inline=True)
         embed.add_field(name="Guilds", value=str(len(bot.guilds)), inline=True)
-        embed.add_field(name="Members", value=str(sum(g.member_count for g in bot.guilds)), inline=True)
+        embed.add_field(name="Members", value=str(_total_members()), inline=True)
         embed.add_field(name="CPU Usage", value=str(cpu), inline=True)
         embed.add_field(name="Memory Usage", value=str(mem_usage), inline=True)
         embed.add_field(name="Host", value=f"{hostname} ({ip})", inline=True)
@@ -2234,9 +2526,7 @@ async def status_cmd(ctx: commands.Context):
 async def ideas_cmd(ctx: commands.Context):
     """Show top AI-generated ideas."""
     try:
-        import json
-        with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-            state = json.load(f)
+        state = state_store.get()
         ideas = state.get("ideas", {}).get("top_ideas", [])
         if ideas:
             idea_list = "\n".join(f"- **{i.get('name','')}**: {i.get('description','')}" for i in ideas)
@@ -2257,7 +2547,7 @@ def run_bot():
     try:
         bot.run(DISCORD_TOKEN)
     except Exception as e:
-        logger.error(f"Failed to run bot: {e}")
+        logger.error("Failed to run bot: %s", e)
 
 if __name__ == "__main__":
     run_bot()
\ No newline at end of file
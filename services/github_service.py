@@ -3,6 +3,7 @@ GitHub API wrapper for Monsterrr.
 """
 
 
+import atexit
 import os
 import time
 import threading
@@ -13,10 +14,91 @@ import logging
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from typing import Optional, List, Dict, Any
 
-# Global rate limiting tracker
-_rate_limit_lock = threading.Lock()
-_last_request_time = 0
-_min_request_interval = 1.0  # Minimum time between requests in seconds
+class Pacer:
+    """Space requests at least ``1 / rate`` seconds apart across all threads.
+
+    ``slow_down()`` halves the rate after a rate-limit response; it then recovers
+    by 10% per minute back up to the configured rate.
+    """
+    MIN_RATE = 0.05  # never slower than one request every 20 seconds
+
+    def __init__(self, rate_per_sec: float):
+        self.max_rate = rate_per_sec
+        self.rate = rate_per_sec
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+        self._last_adjust = time.monotonic()
+
+    def wait(self):
+        """Block until this caller's request slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            minutes = int((now - self._last_adjust) // 60)
+            if minutes and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate * 1.1 ** minutes)
+                self._last_adjust += minutes * 60
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+    def slow_down(self):
+        with self._lock:
+            self.rate = max(self.MIN_RATE, self.rate / 2)
+            self._last_adjust = time.monotonic()
+
+# Shared by every GitHubService instance: about one request per second, under the 5000/hour API budget
+_pacer = Pacer(rate_per_sec=1.0)
+# Shared by every GitHubService instance so requests reuse pooled keep-alive connections
+# instead of paying a TCP and TLS handshake each; httpx.Client is safe to use across threads
+_http = httpx.Client(timeout=30)
+atexit.register(_http.close)
+
+# Everything get_organization_stats() reports, apart from public members, which GraphQL does not
+# expose. Repositories come newest first, matching the REST default; the first page rides along
+# with the org counts and ORG_REPOS_PAGE_QUERY follows endCursor for the rest.
+ORG_REPO_FIELDS = """
+fragment RepoFields on RepositoryConnection {
+  pageInfo { hasNextPage endCursor }
+  nodes {
+    name
+    description
+    primaryLanguage { name }
+    stargazerCount
+    forkCount
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    updatedAt
+    createdAt
+    isPrivate
+    url
+  }
+}
+"""
+
+ORG_SNAPSHOT_QUERY = """
+query($org: String!) {
+  organization(login: $org) {
+    login
+    description
+    createdAt
+    updatedAt
+    membersWithRole { totalCount }
+    teams { totalCount }
+    publicRepos: repositories(privacy: PUBLIC) { totalCount }
+    privateRepos: repositories(privacy: PRIVATE) { totalCount }
+    repositories(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) { ...RepoFields }
+  }
+}
+""" + ORG_REPO_FIELDS
+
+ORG_REPOS_PAGE_QUERY = """
+query($org: String!, $cursor: String!) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) { ...RepoFields }
+  }
+}
+""" + ORG_REPO_FIELDS
 
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors."""
@@ -32,20 +114,16 @@ class BaseService:
 
     def _rate_limit_delay(self):
         """Ensure we don't make requests too quickly"""
-        global _last_request_time, _rate_limit_lock, _min_request_interval
-        with _rate_limit_lock:
-            current_time = time.time()
-            time_since_last_request = current_time - _last_request_time
-            if time_since_last_request < _min_request_interval:
-                sleep_time = _min_request_interval - time_since_last_request
-                time.sleep(sleep_time)
-            _last_request_time = time.time()
+        _pacer.wait()
 
     def log_request(self, method: str, url: str, **kwargs):
         # Apply rate limiting before each request
         self._rate_limit_delay()
         if self.logger:
-            self.logger.info(f"[GitHubService] {method} {url} | kwargs: { {k: v for k, v in kwargs.items() if k != 'headers'} }")
+            self.logger.info("[GitHubService] %s %s", method, url)
+            # Request bodies can carry whole base64-encoded files; only render them when DEBUG is on.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("[GitHubService] %s %s | kwargs: %s", method, url, {k: v for k, v in kwargs.items() if k != 'headers'})
 
     def log_response(self, resp: httpx.Response):
         if self.logger:
@@ -78,9 +156,8 @@ class GitHubService(BaseService):
         if not self.org:
             raise RuntimeError("Missing GITHUB_ORG")
         try:
-            with httpx.Client(timeout=10) as client:
-                user_resp = client.get(f"{self.BASE_URL}/user", headers=self.headers)
-                org_resp = client.get(f"{self.BASE_URL}/orgs/{self.org}", headers=self.headers)
+            user_resp = _http.get(f"{self.BASE_URL}/user", headers=self.headers, timeout=10)
+            org_resp = _http.get(f"{self.BASE_URL}/orgs/{self.org}", headers=self.headers, timeout=10)
             if user_resp.status_code != 200:
                 raise RuntimeError(f"GitHub token invalid: {user_resp.text}")
             if org_resp.status_code != 200:
@@ -99,21 +176,73 @@ class GitHubService(BaseService):
             self.logger.error(f"[GitHubService] Error getting org info: {e}")
             return {}
     
+    def _graphql_organization(self, query: str, **variables) -> Dict[str, Any]:
+        variables["org"] = self.org
+        resp = self._request("POST", self.GRAPHQL_URL, json={"query": query, "variables": variables})
+        payload = resp.json()
+        if payload.get("errors") or not (payload.get("data") or {}).get("organization"):
+            raise GitHubAPIError(f"GraphQL org snapshot failed: {payload.get('errors')}")
+        return payload["data"]["organization"]
+
+    def graphql_org_snapshot(self) -> Dict[str, Any]:
+        """Fetch the organization, its counts and all of its repositories, 100 per GraphQL request."""
+        org = self._graphql_organization(ORG_SNAPSHOT_QUERY)
+        page = org["repositories"]
+        nodes = list(page["nodes"])
+        while page["pageInfo"]["hasNextPage"]:
+            page = self._graphql_organization(ORG_REPOS_PAGE_QUERY, cursor=page["pageInfo"]["endCursor"])["repositories"]
+            nodes.extend(page["nodes"])
+        org["repositories"]["nodes"] = nodes
+        return org
+
     def get_organization_stats(self) -> Dict[str, Any]:
         """Get organization statistics including repo count, member count, etc."""
+        try:
+            org = self.graphql_org_snapshot()
+            try:
+                public_members_resp = self._request("GET", f"{self.BASE_URL}/orgs/{self.org}/public_members")
+                public_members = public_members_resp.json()
+            except Exception:
+                public_members = []
+            public_repos = org["publicRepos"]["totalCount"]
+            private_repos = org["privateRepos"]["totalCount"]
+            return {
+                "name": org.get("login") or self.org,
+                "description": org.get("description") or "",
+                "public_repos": public_repos,
+                "private_repos": private_repos,
+                "total_repos": public_repos + private_repos,
+                "members": org["membersWithRole"]["totalCount"],
+                "public_members": len(public_members),
+                "teams": org["teams"]["totalCount"],
+                "created_at": org.get("createdAt", ""),
+                "updated_at": org.get("updatedAt", ""),
+                "repositories": [
+                    {
+                        "name": r["name"],
+                        "description": r.get("description") or "",
+                        "language": (r.get("primaryLanguage") or {}).get("name", ""),
+                        "stars": r.get("stargazerCount", 0),
+                        "forks": r.get("forkCount", 0),
+                        # REST's open_issues_count includes open pull requests
+                        "issues": r["issues"]["totalCount"] + r["pullRequests"]["totalCount"],
+                        "updated_at": r.get("updatedAt", ""),
+                        "created_at": r.get("createdAt", ""),
+                        "private": r.get("isPrivate", False),
+                        "url": r.get("url", "")
+                    }
+                    for r in org["repositories"]["nodes"]
+                ]
+            }
+        except Exception as e:
+            self.logger.warning(f"[GitHubService] GraphQL org snapshot unavailable, falling back to REST: {e}")
         try:
             # Get organization info
             org_info = self.get_organization_info()
             
-            # Add delay before next request
-            time.sleep(1.5)  # Increased delay
-            
             # Get repositories
             repos = self.list_repositories()
             
-            # Add delay before next request
-            time.sleep(1.5)  # Increased delay
-            
             # Get members
             members_url = f"{self.BASE_URL}/orgs/{self.org}/members"
             try:
@@ -122,9 +251,6 @@ class GitHubService(BaseService):
             except:
                 members = []
             
-            # Add delay before next request
-            time.sleep(1.5)  # Increased delay
-            
             # Count public and private repos
             public_repos = [r for r in repos if not r.get('private', True)]
             private_repos = [r for r in repos if r.get('private', False)]
@@ -138,9 +264,6 @@ class GitHubService(BaseService):
             except:
                 public_members = []
             
-            # Add delay before next request
-            time.sleep(1.5)  # Increased delay
-            
             # Get organization teams
             try:
                 teams_url = f"{self.BASE_URL}/orgs/{self.org}/teams"
@@ -173,7 +296,7 @@ class GitHubService(BaseService):
                         "private": r.get("private", False),
                         "url": r.get("html_url", "")
                     }
-                    for r in repos[:50]  # Limit to first 50 repos to reduce memory usage
+                    for r in repos
                 ]
             }
         except Exception as e:
@@ -297,6 +420,7 @@ class GitHubService(BaseService):
     Provides methods for repo, file, issue, PR, and branch management.
     """
     BASE_URL = "https://api.github.com"
+    GRAPHQL_URL = "https://api.github.com/graphql"
 
     def __init__(self, logger: logging.Logger = None):
         logger = logger or logging.getLogger("monsterrr.github")
@@ -312,9 +436,11 @@ class GitHubService(BaseService):
     def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
         self.log_request(method, url, **kwargs)
         try:
-            with httpx.Client(timeout=30) as client:
-                resp = client.request(method, url, headers=self.headers, **kwargs)
+            resp = _http.request(method, url, headers=self.headers, **kwargs)
             self.log_response(resp)
+            if resp.status_code == 429 or (resp.status_code == 403 and (
+                    resp.headers.get('X-RateLimit-Remaining') == '0' or 'Retry-After' in resp.headers)):
+                _pacer.slow_down()
             if resp.status_code >= 400:
                 # Check for rate limiting
                 if resp.status_code == 403 and 'X-RateLimit-Remaining' in resp.headers:
@@ -366,9 +492,6 @@ class GitHubService(BaseService):
                     break
                     
                 page += 1
-                
-                # Add a delay between requests to prevent rate limiting
-                time.sleep(1.0)  # Increased delay to 1 second
             except GitHubAPIError as e:
                 if e.status_code == 403 and e.retry_after:
                     self.logger.warning(f"[GitHubService] Rate limit hit while listing repositories. Waiting {e.retry_after} seconds.")
@@ -594,9 +717,6 @@ class GitHubService(BaseService):
                     break
                     
                 page += 1
-                
-                # Add a delay between requests to prevent rate limiting
-                time.sleep(1.0)  # Increased delay to 1 second
             except GitHubAPIError as e:
                 if e.status_code == 403 and e.retry_after:
                     self.logger.warning(f"[GitHubService] Rate limit hit while listing issues. Waiting {e.retry_after} seconds.")
@@ -2,6 +2,7 @@
 Groq API wrapper for Monsterrr.
 """
 
+import logging
 import requests
 import time
 import os
@@ -112,13 +113,14 @@ class GroqService:
             try:
                 if self.logger:
                     self.logger.info(f"[GroqService] Sending request to Groq API (attempt {attempt+1}) with model {model}")
-                    self.logger.debug(f"[GroqService] Request payload: {str(payload)[:2000]}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("[GroqService] Request payload: %.2000s", payload)
                 if stream:
                     return self._stream_response(payload, headers)
                 resp = requests.post(self.BASE_URL, json=payload, headers=headers, timeout=self.timeout)
                 raw_body = resp.text[:16000]
                 if self.logger:
-                    self.logger.debug(f"[GroqService] Raw response ({resp.status_code}): {raw_body}")
+                    self.logger.debug("[GroqService] Raw response (%s): %s", resp.status_code, raw_body)
                 if resp.status_code == 401:
                     self.logger.error("AUTH FAILED — check GROQ_API_KEY and model access")
                     raise GroqAuthError("Groq API 401 Unauthorized: Check your API key and model access.")
@@ -139,7 +141,7 @@ class GroqService:
                                     resp = requests.post(self.BASE_URL, json=payload, headers=headers, timeout=self.timeout)
                                     raw_body = resp.text[:16000]
                                     if self.logger:
-                                        self.logger.debug(f"[GroqService] Fallback raw response ({resp.status_code}): {raw_body}")
+                                        self.logger.debug("[GroqService] Fallback raw response (%s): %s", resp.status_code, raw_body)
                                     if resp.status_code == 200:
                                         data = resp.json()
                                         break
@@ -241,7 +243,7 @@ class GroqService:
                         except Exception as e:
                             if self.logger:
                                 self.logger.error(f"Groq response was not valid JSON: {e}")
-                                self.logger.debug(f"Groq response content: {content}")
+                                self.logger.debug("Groq response content: %s", content)
                             # Try to fix common JSON issues
                             try:
                                 # Fix common issues like single quotes, trailing commas
@@ -289,7 +291,7 @@ class GroqService:
                     try:
                         chunk = line.decode("utf-8")
                         if self.logger:
-                            self.logger.debug(f"[GroqService] Stream chunk: {chunk}")
+                            self.logger.debug("[GroqService] Stream chunk: %s", chunk)
                         yield chunk
                     except Exception as e:
                         if self.logger:
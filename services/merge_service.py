@@ -1,7 +1,6 @@
 # Auto-merge & Auto-close Rules Service
 
-import json
-import os
+from utils import jsonio
 
 class MergeService:
     def __init__(self, file_path="merge_log.json"):
@@ -9,20 +8,10 @@ class MergeService:
         self.log = self._load_log()
 
     def _load_log(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
+        return jsonio.load_file(self.file_path, [])
 
     def _save_log(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.log, f)
-        except Exception:
-            pass
+        jsonio.save_file(self.file_path, self.log)
 
     def auto_merge(self, pr):
         entry = {'action': 'auto-merge', 'pr': pr}
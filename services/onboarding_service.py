@@ -1,7 +1,6 @@
 # Onboarding Automation Service
 
-import json
-import os
+from utils import jsonio
 
 class OnboardingService:
     def __init__(self, file_path="onboarding_log.json"):
@@ -9,20 +8,10 @@ class OnboardingService:
         self.log = self._load_log()
 
     def _load_log(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
+        return jsonio.load_file(self.file_path, [])
 
     def _save_log(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.log, f)
-        except Exception:
-            pass
+        jsonio.save_file(self.file_path, self.log)
 
     def onboard(self, user):
         msg = f"Welcome {user}! Here are your first tasks."
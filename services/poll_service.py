@@ -1,7 +1,6 @@
 # Idea Voting & Polls Service
 
-import json
-import os
+from utils import jsonio
 
 class PollService:
     def __init__(self, file_path="polls.json"):
@@ -9,20 +8,10 @@ class PollService:
         self.polls = self._load_polls()
 
     def _load_polls(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
+        return jsonio.load_file(self.file_path, [])
 
     def _save_polls(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.polls, f)
-        except Exception:
-            pass
+        jsonio.save_file(self.file_path, self.polls)
 
     def create_poll(self, question, options):
         poll = {'question': question, 'options': list(options), 'votes': {}}
@@ -1,7 +1,6 @@
 # Scheduled Q&A Sessions Service
 
-import json
-import os
+from utils import jsonio
 
 class QAService:
     def __init__(self, file_path="qa_sessions.json"):
@@ -9,20 +8,10 @@ class QAService:
         self.sessions = self._load_sessions()
 
     def _load_sessions(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
+        return jsonio.load_file(self.file_path, [])
 
     def _save_sessions(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.sessions, f)
-        except Exception:
-            pass
+        jsonio.save_file(self.file_path, self.sessions)
 
     def schedule_qa(self, time):
         entry = {'time': time, 'status': 'scheduled'}
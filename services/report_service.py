@@ -11,8 +11,8 @@ class ReportService:
     def _load_state(self):
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(self.state_file, "rb") as f:
+                    return json.loads(f.read())
             except Exception:
                 return {}
         return {}
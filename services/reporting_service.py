@@ -3,13 +3,165 @@ Reporting Service for Monsterrr.
 Handles comprehensive status reporting via email and Discord.
 """
 
-import os
-import json
+import gzip
+import io
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import time
+from email.generator import BytesGenerator
+from email.message import EmailMessage
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from utils import state_store
+
+# HTML bodies above this size are sent gzip-compressed as an attachment instead of inline
+HTML_INLINE_LIMIT = 32 * 1024
+
+# Startup and status emails are built back to back; both reuse a report this fresh
+REPORT_CACHE_TTL = 45
+
+# Static scaffolding of the HTML report, filled in with format() so only the values are built per report
+HTML_REPORT_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Monsterrr Status Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
+        .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
+        .header {{ background: #2d7ff9; color: white; padding: 20px; border-radius: 8px 8px 0 0; margin: -30px -30px 20px -30px; }}
+        .section {{ margin: 20px 0; }}
+        .summary-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin: 20px 0; }}
+        .summary-item {{ background: #f0f8ff; padding: 15px; border-radius: 8px; text-align: center; }}
+        .summary-value {{ font-size: 24px; font-weight: bold; color: #2d7ff9; }}
+        .summary-label {{ font-size: 14px; color: #666; }}
+        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+        th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
+        th {{ background-color: #f2f2f2; }}
+        .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee; color: #666; font-size: 12px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Monsterrr Status Report</h1>
+            <p>Generated on {generated_at}</p>
+        </div>
+        
+        <div class="section">
+            <h2>Summary</h2>
+            <div class="summary-grid">
+                <div class="summary-item">
+                    <div class="summary-value">{repositories}</div>
+                    <div class="summary-label">Repositories</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">{ideas}</div>
+                    <div class="summary-label">Ideas</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">{actions}</div>
+                    <div class="summary-label">Actions</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">{branches}</div>
+                    <div class="summary-label">Branches</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">{members}</div>
+                    <div class="summary-label">Members</div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="section">
+            <h2>Recent Activity</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Time</th>
+                        <th>Action</th>
+                        <th>Details</th>
+                    </tr>
+                </thead>
+                <tbody>
+        """
+HTML_REPORT_IDEAS_HEAD = """
+                </tbody>
+            </table>
+        </div>
+        
+        <div class="section">
+            <h2>Top Ideas</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Name</th>
+                        <th>Description</th>
+                        <th>Tech Stack</th>
+                    </tr>
+                </thead>
+                <tbody>
+        """
+HTML_REPORT_FOOT = """
+                </tbody>
+            </table>
+        </div>
+        
+        <div class="footer">
+            <p>This is an automated report from Monsterrr, your autonomous GitHub organization manager.</p>
+            <p>Report generated at {generated_at}</p>
+        </div>
+    </div>
+</body>
+</html>
+        """
+
+def build_message(subject: str, sender: str, recipients: List[str], text: str, html: str) -> EmailMessage:
+    """Build a plain-text email with an HTML alternative.
+
+    HTML larger than HTML_INLINE_LIMIT is attached gzip-compressed instead of inlined.
+    """
+    msg = EmailMessage()
+    msg['Subject'] = subject
+    msg['From'] = sender
+    msg['To'] = ", ".join(recipients)
+    msg.set_content(text)
+    html_bytes = html.encode('utf-8')
+    if len(html_bytes) <= HTML_INLINE_LIMIT:
+        msg.add_alternative(html, subtype='html')
+    else:
+        msg.add_attachment(gzip.compress(html_bytes), maintype='application', subtype='gzip', filename='report.html.gz')
+    return msg
+
+# Recipients per SMTP transaction; a full batch with more than a third refused aborts the rest
+SMTP_BATCH_SIZE = 30
+
+def send_message_batched(server: smtplib.SMTP, msg, from_addr: str, recipients: List[str], logger=None) -> bool:
+    """Send ``msg`` over an open SMTP session in batches of SMTP_BATCH_SIZE recipients.
+
+    Returns True if at least one recipient accepted the message.
+    """
+    # Flatten once (as send_message() would) instead of re-serializing the MIME tree per batch
+    buf = io.BytesIO()
+    BytesGenerator(buf, mangle_from_=False).flatten(msg, linesep='\r\n')
+    payload = buf.getvalue()
+    delivered = 0
+    for start in range(0, len(recipients), SMTP_BATCH_SIZE):
+        batch = recipients[start:start + SMTP_BATCH_SIZE]
+        try:
+            refused = server.sendmail(from_addr, batch, payload)
+        except smtplib.SMTPRecipientsRefused as e:
+            refused = e.recipients
+        delivered += len(batch) - len(refused)
+        if refused and logger:
+            logger.warning("SMTP refused %d recipient(s): %s", len(refused), ", ".join(refused))
+        if len(batch) >= SMTP_BATCH_SIZE and len(refused) > len(batch) // 3:
+            if logger:
+                logger.error("Too many recipients refused; aborting the remaining batches.")
+            break
+    return delivered > 0
 
 class ReportingService:
     """Service for generating and sending comprehensive reports."""
@@ -23,14 +175,25 @@ class ReportingService:
         self.smtp_pass = smtp_pass
         self.discord_channel = discord_channel
         self.logger = logger
+        self._report_cache = None  # (monotonic build time, report)
         
-    def generate_comprehensive_report(self) -> Dict[str, Any]:
-        """Generate a comprehensive status report."""
+    def generate_comprehensive_report(self, state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate a comprehensive status report, from ``state`` if the caller already has it loaded.
+
+        A report built in the last REPORT_CACHE_TTL seconds is returned as-is.
+        """
+        cached = self._report_cache
+        if cached and time.monotonic() - cached[0] < REPORT_CACHE_TTL:
+            return cached[1]
+        report = self._build_comprehensive_report(state)
+        if "error" not in report:
+            self._report_cache = (time.monotonic(), report)
+        return report
+    
+    def _build_comprehensive_report(self, state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         try:
-            state = {}
-            if os.path.exists("monsterrr_state.json"):
-                with open("monsterrr_state.json", "r", encoding="utf-8") as f:
-                    state = json.load(f)
+            if state is None:
+                state = state_store.get()
             
             # Get repository information
             repos = state.get("repos", [])
@@ -82,8 +245,8 @@ class ReportingService:
         sorted_actions = sorted(actions, key=lambda x: x.get("timestamp", ""), reverse=True)
         return sorted_actions[:5]
     
-    def send_email_report(self, recipients: List[str], report: Dict[str, Any]) -> bool:
-        """Send a comprehensive email report."""
+    def send_email_report(self, recipients: List[str], report: Dict[str, Any], server: Optional[smtplib.SMTP] = None) -> bool:
+        """Send a comprehensive email report, reusing ``server`` when an authenticated session is passed in."""
         if not self.smtp_host or not self.smtp_user or not self.smtp_pass:
             if self.logger:
                 self.logger.warning("SMTP not configured. Skipping email report.")
@@ -103,22 +266,21 @@ class ReportingService:
             # Generate text content
             text_content = self._generate_text_report(report)
             
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.smtp_user
-            msg['To'] = ", ".join(recipients)
-            
-            # Add parts to message
-            msg.attach(MIMEText(text_content, 'plain'))
-            msg.attach(MIMEText(html_content, 'html'))
+            msg = build_message(subject, self.smtp_user, recipients, text_content, html_content)
             
             # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_pass)
-                server.sendmail(self.smtp_user, recipients, msg.as_string())
+            if server is not None:
+                sent = send_message_batched(server, msg, self.smtp_user, recipients, self.logger)
+            else:
+                with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+                    server.starttls()
+                    server.login(self.smtp_user, self.smtp_pass)
+                    sent = send_message_batched(server, msg, self.smtp_user, recipients, self.logger)
             
+            if not sent:
+                if self.logger:
+                    self.logger.error("Email report was refused by every recipient: %s", recipients)
+                return False
             if self.logger:
                 self.logger.info(f"Email report sent successfully to {recipients}")
             return True
@@ -133,125 +295,38 @@ class ReportingService:
         repos = report.get("repositories", [])
         ideas = report.get("ideas", [])
         actions = report.get("actions", [])
+        generated_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
         
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Monsterrr Status Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
-        .header {{ background: #2d7ff9; color: white; padding: 20px; border-radius: 8px 8px 0 0; margin: -30px -30px 20px -30px; }}
-        .section {{ margin: 20px 0; }}
-        .summary-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin: 20px 0; }}
-        .summary-item {{ background: #f0f8ff; padding: 15px; border-radius: 8px; text-align: center; }}
-        .summary-value {{ font-size: 24px; font-weight: bold; color: #2d7ff9; }}
-        .summary-label {{ font-size: 14px; color: #666; }}
-        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee; color: #666; font-size: 12px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Monsterrr Status Report</h1>
-            <p>Generated on {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-        </div>
-        
-        <div class="section">
-            <h2>Summary</h2>
-            <div class="summary-grid">
-                <div class="summary-item">
-                    <div class="summary-value">{summary.get('repositories', 0)}</div>
-                    <div class="summary-label">Repositories</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value">{summary.get('ideas', 0)}</div>
-                    <div class="summary-label">Ideas</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value">{summary.get('actions', 0)}</div>
-                    <div class="summary-label">Actions</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value">{summary.get('branches', 0)}</div>
-                    <div class="summary-label">Branches</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value">{summary.get('members', 0)}</div>
-                    <div class="summary-label">Members</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>Recent Activity</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Time</th>
-                        <th>Action</th>
-                        <th>Details</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """
+        parts = [HTML_REPORT_HEAD.format(
+            generated_at=generated_at,
+            repositories=summary.get('repositories', 0),
+            ideas=summary.get('ideas', 0),
+            actions=summary.get('actions', 0),
+            branches=summary.get('branches', 0),
+            members=summary.get('members', 0),
+        )]
         
-        for action in report.get("recent_activity", [])[:10]:  # Show only top 10
-            html += f"""
+        parts.extend(f"""
                     <tr>
                         <td>{action.get('timestamp', 'N/A')[:19]}</td>
                         <td>{action.get('type', 'N/A')}</td>
                         <td>{str(action.get('details', 'N/A'))[:100]}...</td>
                     </tr>
-            """
+            """ for action in report.get("recent_activity", [])[:10])  # Show only top 10
         
-        html += """
-                </tbody>
-            </table>
-        </div>
+        parts.append(HTML_REPORT_IDEAS_HEAD)
         
-        <div class="section">
-            <h2>Top Ideas</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Name</th>
-                        <th>Description</th>
-                        <th>Tech Stack</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """
-        
-        for idea in ideas[:5]:  # Show only top 5
-            html += f"""
+        parts.extend(f"""
                     <tr>
                         <td>{idea.get('name', 'N/A')}</td>
                         <td>{idea.get('description', 'N/A')[:100]}...</td>
                         <td>{', '.join(idea.get('tech_stack', []))[:50]}...</td>
                     </tr>
-            """
+            """ for idea in ideas[:5])  # Show only top 5
         
-        html += """
-                </tbody>
-            </table>
-        </div>
+        parts.append(HTML_REPORT_FOOT.format(generated_at=generated_at))
         
-        <div class="footer">
-            <p>This is an automated report from Monsterrr, your autonomous GitHub organization manager.</p>
-            <p>Report generated at {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-        </div>
-    </div>
-</body>
-</html>
-        """
-        
-        return html
+        return "".join(parts)
     
     def _generate_text_report(self, report: Dict[str, Any]) -> str:
         """Generate plain text report content."""
@@ -259,10 +334,11 @@ class ReportingService:
         repos = report.get("repositories", [])
         ideas = report.get("ideas", [])
         actions = report.get("actions", [])
+        generated_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
         
-        text = f"""
+        parts = [f"""
 Monsterrr Status Report
-Generated on {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
+Generated on {generated_at}
 
 SUMMARY
 =======
@@ -274,35 +350,33 @@ Members: {summary.get('members', 0)}
 
 RECENT ACTIVITY
 ===============
-        """
+        """]
         
-        for action in report.get("recent_activity", [])[:10]:  # Show only top 10
-            text += f"""
+        parts.extend(f"""
 {action.get('timestamp', 'N/A')[:19]} - {action.get('type', 'N/A')}
   Details: {str(action.get('details', 'N/A'))[:100]}...
-            """
+            """ for action in report.get("recent_activity", [])[:10])  # Show only top 10
         
-        text += f"""
+        parts.append(f"""
 
 TOP IDEAS
 =========
-        """
+        """)
         
-        for idea in ideas[:5]:  # Show only top 5
-            text += f"""
+        parts.extend(f"""
 Name: {idea.get('name', 'N/A')}
 Description: {idea.get('description', 'N/A')[:100]}...
 Tech Stack: {', '.join(idea.get('tech_stack', []))}
-            """
+            """ for idea in ideas[:5])  # Show only top 5
         
-        text += f"""
+        parts.append(f"""
 
 --
 This is an automated report from Monsterrr, your autonomous GitHub organization manager.
-Report generated at {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
-        """
+Report generated at {generated_at}
+        """)
         
-        return text
+        return "".join(parts)
     
     def send_discord_report(self, report: Dict[str, Any]) -> bool:
         """Send a report to Discord."""
@@ -1,29 +1,20 @@
 # Security & Compliance Monitoring Service
 
 import os
-import json
 import re
 
+from utils import jsonio
+
 class SecurityService:
     def __init__(self, file_path="security_scan_log.json"):
         self.file_path = file_path
         self.log = self._load_log()
 
     def _load_log(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
+        return jsonio.load_file(self.file_path, [])
 
     def _save_log(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.log, f)
-        except Exception:
-            pass
+        jsonio.save_file(self.file_path, self.log)
 
     def scan_repo(self, repo_path):
         # Scan for secrets in .env and source files
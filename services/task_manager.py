@@ -1,7 +1,6 @@
 # Task Assignment & Tracking Service
 
-import json
-import os
+from utils import jsonio
 
 class TaskManager:
     def __init__(self, file_path="tasks.json"):
@@ -9,20 +8,10 @@ class TaskManager:
         self.tasks = self._load_tasks()
 
     def _load_tasks(self):
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return []
-        return []
+        return jsonio.load_file(self.file_path, [])
 
     def _save_tasks(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.tasks, f)
-        except Exception:
-            pass
+        jsonio.save_file(self.file_path, self.tasks)
 
     def assign_task(self, user, task):
         self.tasks.append({'user': user, 'task': task, 'status': 'assigned'})
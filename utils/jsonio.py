@@ -0,0 +1,112 @@
+"""
+JSON encoding and file helpers shared by the file-backed services.
+
+orjson is used when it is installed and the stdlib json module otherwise. Both paths use the
+same options: compact output, non-string dict keys coerced to strings and anything else that
+is not JSON written with str().
+"""
+
+import json
+import logging
+import os
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+logger = logging.getLogger("monsterrr.jsonio")
+
+
+def dumps(obj) -> bytes:
+    """Encode ``obj`` as compact JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def loads(data):
+    """Decode JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def load_file(path, default):
+    """Return the JSON document in ``path``, or ``default`` if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return default
+    except OSError as e:
+        logger.error("Failed to read %s: %s", path, e)
+        return default
+    try:
+        return loads(data)
+    except ValueError as e:
+        logger.warning("Ignoring unparseable %s: %s", path, e)
+        return default
+
+
+def save_file(path, obj) -> bool:
+    """Write ``obj`` to ``path`` with a single write call; failures are logged, not raised."""
+    try:
+        data = dumps(obj)
+        with open(path, "wb") as f:
+            f.write(data)
+        return True
+    except Exception as e:
+        logger.error("Failed to save %s: %s", path, e)
+        return False
+
+
+# NDJSON logs: one entry per line, so recording an entry appends instead of rewriting the file
+
+def read_lines(path) -> list:
+    """Return the entries of the NDJSON file ``path``; [] if it is missing."""
+    entries = []
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(loads(line))
+                except ValueError:
+                    continue  # skip a line torn by an interrupted write
+    except FileNotFoundError:
+        return []
+    except OSError as e:
+        logger.error("Failed to read %s: %s", path, e)
+        return []
+    return entries
+
+
+def append_line(path, obj) -> bool:
+    """Append ``obj`` to the NDJSON file ``path``; failures are logged, not raised."""
+    try:
+        line = dumps(obj) + b"\n"
+        with open(path, "ab+") as f:
+            # If an interrupted write left a partial last line, start this entry on a fresh one
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+        return True
+    except Exception as e:
+        logger.error("Failed to append to %s: %s", path, e)
+        return False
+
+
+def write_lines(path, objs) -> bool:
+    """Replace the NDJSON file ``path`` with ``objs`` in one write, via a temp file and os.replace()."""
+    tmp_path = path + ".tmp"
+    try:
+        data = b"".join(dumps(obj) + b"\n" for obj in objs)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        logger.error("Failed to write %s: %s", path, e)
+        return False
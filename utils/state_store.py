@@ -0,0 +1,149 @@
+"""
+In-process cache of monsterrr_state.json with debounced, atomic writes.
+
+The state is read once and kept in memory. Changes go through ``update()``,
+and a background timer writes them out ``FLUSH_DELAY`` seconds later, so a
+burst of updates costs a single write. Updates are kept until they are
+written: if another writer changes the file in the meantime, the next
+``get()`` or ``flush()`` reloads it and replays them on top, so neither
+side's changes are lost.
+
+``update()`` is copy-on-write. The dict returned by ``get()`` is a snapshot
+that is never mutated afterwards, so it is safe to iterate from any thread.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from utils.jsonio import orjson, dumps, loads
+
+STATE_PATH = "monsterrr_state.json"
+FLUSH_DELAY = 2.0
+# Set MONSTERRR_PRETTY_STATE=1 to write an indented, human-readable state file while debugging
+PRETTY_STATE = os.getenv("MONSTERRR_PRETTY_STATE") == "1"
+
+_lock = threading.RLock()
+_state = None
+_mtime = None  # st_mtime_ns of the file as of our last read or write
+_pending = []  # update functions applied since the last flush
+_timer = None
+_last_digest = None
+
+
+def _file_mtime():
+    try:
+        return os.stat(STATE_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read():
+    """Return the parsed file, {} if it is missing, or None if it cannot be parsed."""
+    try:
+        with open(STATE_PATH, "rb") as f:
+            data = f.read()
+    except OSError:
+        return {}
+    try:
+        state = loads(data)
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else {}
+
+
+def _serialize(state):
+    if not PRETTY_STATE:
+        return dumps(state)
+    if orjson:
+        return orjson.dumps(state, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2, default=str).encode("utf-8")
+
+
+def _copy(state):
+    # The state is plain JSON, and a JSON round trip is much cheaper than copy.deepcopy
+    return loads(dumps(state))
+
+
+def _reload():
+    """Reload the file if someone else changed it, replaying pending updates; False if it is unreadable."""
+    global _state, _mtime
+    mtime = _file_mtime()
+    if _state is not None and mtime == _mtime:
+        return True
+    state = _read()
+    if state is None:
+        if _state is not None:
+            return False  # most likely caught mid-write; keep the cache and look again later
+        state = {}
+    for fn in _pending:
+        fn(state)
+    _state, _mtime = state, mtime
+    return True
+
+
+def get():
+    """Return the current state. Treat it as read-only; change it through update()."""
+    with _lock:
+        _reload()
+        return _state
+
+
+def update(fn):
+    """Apply ``fn(state)`` to a copy of the state, schedule a flush and return fn's result.
+
+    ``fn`` may be applied again to a freshly reloaded state before the flush, so it
+    should only describe the change (set a key, append an entry), not depend on being called once.
+    """
+    global _state
+    with _lock:
+        state = _copy(get())
+        result = fn(state)
+        _state = state
+        _pending.append(fn)
+        _schedule()
+        return result
+
+
+def _schedule():
+    global _timer
+    if _timer is None:
+        _timer = threading.Timer(FLUSH_DELAY, flush)
+        _timer.daemon = True
+        _timer.start()
+
+
+def flush():
+    """Write pending changes now via a temp file and os.replace(); skipped if the bytes are unchanged."""
+    global _timer, _mtime, _last_digest
+    with _lock:
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+        if not _pending:
+            return
+        if not _reload():
+            _schedule()
+            return
+        data = _serialize(_state)
+        digest = hashlib.blake2b(data).digest()
+        if digest != _last_digest:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(STATE_PATH)), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb", buffering=65536) as f:
+                    f.write(data)
+                    f.flush()
+                    mtime = os.fstat(f.fileno()).st_mtime_ns
+                os.replace(tmp_path, STATE_PATH)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            _last_digest = digest
+            _mtime = mtime
+        _pending.clear()
+
+
+atexit.register(flush)